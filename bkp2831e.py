@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import collections
+import functools
+import json
+import logging
+import os
+import queue
 import re
+import sys
+import threading
 import time
 import time as _t
-from datetime import datetime
 from typing import Optional, Union, Tuple
 
 # Optional deps (exist in real app)
@@ -17,9 +24,43 @@ except Exception:  # make module importable in environments without pyserial
 
 # ---- logging helper ---------------------------------------------------------
 
+_logger = logging.getLogger("bkp2831e")
+
+# driver status tag -> logging level (unknown tags log at INFO)
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "SCRIPT_ENGINE": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
 def _default_logger(message: str, status: str = "SCRIPT_ENGINE") -> None:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{ts}][{status}] {message}")
+    _logger.log(_LEVELS.get(status, logging.INFO), message)
+
+# ---- response parsing -------------------------------------------------------
+
+# Numeric token in a raw (bytes) reply line, e.g. b"+1.2345E+00", b"12.5 VDC"
+_FLOAT_RX = re.compile(rb"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Model token in the *IDN? reply
+_IDN_RX = re.compile(r"2831\s*E", re.IGNORECASE)
+
+# Reading multipliers per function, keyed by lower-cased unit name.
+# Unknown units fall back to 1.0 (base unit). Note "Ω".lower() == "ω".
+_UNIT_MULT = {
+    "volt:dc": {"v": 1.0, "mv": 1e3},
+    "volt:ac": {"v": 1.0, "mv": 1e3},
+    "curr:dc": {"a": 1.0, "ma": 1e3},
+    "curr:ac": {"a": 1.0, "ma": 1e3},
+    "res": {
+        "ohm": 1.0, "ω": 1.0,
+        "kohm": 1e-3, "kω": 1e-3, "k": 1e-3,
+        "mohm": 1e-6, "mω": 1e-6, "m": 1e-6,
+    },
+    "freq": {"hz": 1.0, "khz": 1e-3, "mhz": 1e-6},
+    "per": {"s": 1.0, "ms": 1e3, "us": 1e6, "µs": 1e6},
+}
 
 # ---- main BKP 2831E driver --------------------------------------------------
 
@@ -46,23 +87,34 @@ class BKP_2831E:
         self.dmm_id: Optional[str] = None
 
         # state cached by driver
-        self.voltage_range_dc: Optional[str] = None
-        self.current_range_dc: Optional[str] = None
+        self.voltage_range_dc: Union[str, float, None] = None
+        self.current_range_dc: Union[str, float, None] = None
         self.active_function: Optional[str] = None  # e.g. "volt:dc", "res", etc.
 
         # Additional optional cached ranges for convenience (not required to use)
-        self.voltage_range_ac: Optional[str] = None
-        self.current_range_ac: Optional[str] = None
-        self.res_range: Optional[str] = None
-        self.freq_range: Optional[str] = None
+        self.voltage_range_ac: Union[str, float, None] = None
+        self.current_range_ac: Union[str, float, None] = None
+        self.res_range: Union[str, float, None] = None
+        self.freq_range: Union[str, float, None] = None
         self.temp_unit: str = "C"
         self.trigger_source: str = "IMM"
+        # Whether the meter echoes commands (SYST:RETURN). None = unknown, in
+        # which case non-query writes still wait for a possible echo line.
+        self._echo_on: Optional[bool] = None
+        # Whether the meter takes ';'-joined compound commands; probed on
+        # connect. When False, batched commands are sent one per line.
+        self._supports_compound = True
 
         # --- comm robustness state ---
-        self._min_cmd_interval = 0.04   # seconds, throttle between commands
-        self._last_cmd_ts = 0.0
-        self.cooloff_until = 0.0        # epoch seconds; during cooloff we avoid reads
+        # All timestamps below are time.monotonic_ns() values (immune to
+        # wall-clock/NTP jumps).
+        self._min_cmd_interval_ns = 0   # throttle between commands; adaptive
+        self._base_cmd_interval_ns = 0  # interval we decay back to on success
+        self._avg_rtt_ns: Optional[float] = None  # EWMA of FETCH round-trip
+        self._last_cmd_ns = 0
+        self.cooloff_until_ns = 0       # during cooloff we avoid reads
         self._error_streak = 0          # consecutive fetch failures
+        self._seed_cmd_interval()
         self._nplc_cache = {}           # per-function remembered NPLC
 
         # Try to pre-select a COM port (non-fatal if not found); do NOT auto-connect
@@ -73,6 +125,13 @@ class BKP_2831E:
 
         # Do not auto-connect here; let caller call connect() explicitly if desired
 
+    def _debug_enabled(self) -> bool:
+        """
+        True if a DEBUG message would be emitted. Lets hot paths skip building
+        the message; custom loggers are always assumed to want it.
+        """
+        return self.log is not _default_logger or _logger.isEnabledFor(logging.DEBUG)
+
     def set_baudrate(self, baudrate: int) -> None:
         """
         Update the baud rate used for talking to the DMM on the PC side.
@@ -94,6 +153,7 @@ class BKP_2831E:
             return  # nothing to do
 
         self.baud = baud_int
+        self._seed_cmd_interval()
         self.log(f"DMM: Using baud rate {self.baud}", status="INFO")
 
         ser = getattr(self, "dmm_ser", None)
@@ -143,11 +203,12 @@ class BKP_2831E:
             return getattr(info, "device", None) or getattr(info, "name", None) or str(info)
 
         if cp210x_ports:
-            self.log(
-                "DMM: Prioritizing CP210x ports: "
-                + ", ".join(_port_name(p) for p in cp210x_ports),
-                status="DEBUG",
-            )
+            if self._debug_enabled():
+                self.log(
+                    "DMM: Prioritizing CP210x ports: "
+                    + ", ".join(_port_name(p) for p in cp210x_ports),
+                    status="DEBUG",
+                )
             chosen = cp210x_ports[0]
         else:
             self.log("DMM: No CP210x ports found; DMM probably not connected", status="WARNING")
@@ -160,32 +221,40 @@ class BKP_2831E:
     def connect(self, com_port: Union[int, str, None] = None) -> bool:
         """
         Open the serial port and validate identity.
+
+        An already-open session on the requested port (or any port, if none
+        is requested) is kept and only re-checked with *IDN?; reads never
+        reopen the port, they recover through _light_reset/_heavy_reset and
+        the cool-off window instead.
         """
 
-        # If we already have a serial object open, verify it.
+        # explicit override
+        if com_port is not None:
+            if isinstance(com_port, int):
+                self.com_port = f"COM{com_port}"
+            else:
+                self.com_port = str(com_port)
+
+        # If we already have a serial object open on that port, verify it.
         try:
             if self.dmm_ser and getattr(self.dmm_ser, "is_open", False):
-                if self.get_id():
+                open_port = getattr(self.dmm_ser, "port", None)
+                if self.com_port in (None, open_port) and self.get_id():
+                    self.com_port = open_port or self.com_port
                     self.log(
                         f"DMM: Already connected on {self.com_port} at {self.baud} baud",
                         status="INFO",
                     )
                     return True
-                # ID failed -> close and fall through to a fresh connect attempt
-                try:
-                    self.dmm_ser.close()
-                except Exception:
-                    pass
-                self.dmm_ser = None
+                # Other port requested, or ID failed -> close (which also
+                # drops the cached config and probe results) and fall
+                # through to a fresh connect attempt
+                self.close()
         except Exception:
             self.dmm_ser = None
-
-        # explicit override
-        if com_port is not None:
-            if isinstance(com_port, int):
-                self.com_port = f"COM{com_port}"
-            else:
-                self.com_port = str(com_port)
+            self._echo_on = None
+            self._supports_compound = True
+            self._invalidate_config()
 
         if not self.com_port:
             # if still unset, try scan
@@ -202,13 +271,15 @@ class BKP_2831E:
             self.dmm_ser = serial.Serial(
                 port=self.com_port,
                 baudrate=self.baud,
-                timeout=self.ser_timeout,
+                timeout=_PORT_TIMEOUT_S,
                 write_timeout=self.ser_timeout,
             )
-            time.sleep(0.2)
             if not getattr(self.dmm_ser, "is_open", False):
                 self.log("DMM: Unable to open serial port", status="ERROR")
                 return False
+            # Drop any power-up/line noise; get_id() retries if the meter
+            # is not ready yet, so no fixed settle delay is needed.
+            self.dmm_ser.reset_input_buffer()
         except Exception as e:
             self.log(f"DMM: Serial open failed on {self.com_port}: {e}", status="ERROR")
             return False
@@ -225,6 +296,9 @@ class BKP_2831E:
                 pass
             return False
 
+        self._detect_echo()
+        self._detect_compound()
+
         self.log(
             f"DMM: Connected on {self.com_port} at {self.baud} baud",
             status="INFO",
@@ -239,9 +313,8 @@ class BKP_2831E:
             if getattr(self.dmm_ser, "is_open", False):
                 # Try to return the instrument to LOCAL (front-panel) mode
                 try:
-                    _write_line(self.dmm_ser, "*RST")
-                    self.dmm_ser.flush()
-                    time.sleep(0.05)
+                    # flush() blocks until *RST has left the port
+                    _write_bytes(self.dmm_ser, _CMD_RST)
                 except Exception:
                     # If the command fails (wrong baud / disconnected), just proceed to close
                     pass
@@ -252,24 +325,103 @@ class BKP_2831E:
                     pass
         finally:
             self.dmm_ser = None
+            self._echo_on = None
+            self._supports_compound = True  # re-probed by the next connect()
+            self._invalidate_config()  # *RST (or a power cycle) resets the meter
 
         return True
 
     # --- identity & helpers ---
 
+    def _detect_echo(self) -> None:
+        """
+        Probe whether the meter echoes commands: send *IDN? and check if the
+        first line back is the command itself. Leaves `_echo_on` as None
+        (echo assumed possible) when the probe gets no answer.
+        """
+        try:
+            _write_bytes(self.dmm_ser, _CMD_IDN)
+            first = _readline_bytes(self.dmm_ser, timeout=self.ser_timeout)
+            if first.upper() == _norm_cmd(_QRY_IDN):
+                self._echo_on = True
+                _readline_bytes(self.dmm_ser, timeout=self.ser_timeout)  # ID reply
+            elif first:
+                self._echo_on = False
+            else:
+                self._echo_on = None
+        except Exception as e:
+            self.log(f"DMM: echo probe failed: {e}", status="WARNING")
+            self._echo_on = None
+            return
+        if self._debug_enabled():
+            self.log(f"DMM: command echo {self._echo_on}", status="DEBUG")
+
+    def _detect_compound(self) -> None:
+        """
+        Probe compound-command support: two queries joined with ';' must come
+        back as one line carrying both replies, as SCPI specifies.
+        """
+        try:
+            line = _query_with_optional_echo(
+                self.dmm_ser,
+                _QRY_COMPOUND_PROBE,
+                timeout=self.ser_timeout,
+                payload=_CMD_COMPOUND_PROBE,
+            )
+            self._supports_compound = ";" in line
+        except Exception as e:
+            self.log(f"DMM: compound probe failed: {e}", status="WARNING")
+            self._supports_compound = False
+        finally:
+            try:
+                # A meter answering one line per query leaves the second behind
+                self.dmm_ser.reset_input_buffer()
+            except Exception:
+                pass
+        if self._debug_enabled():
+            self.log(f"DMM: compound commands {self._supports_compound}", status="DEBUG")
+
+    def _write_cmd(self, cmd: str) -> None:
+        """
+        Send a non-query command. The echo read-back (and its timeout) is
+        skipped once the meter is known not to echo.
+        """
+        if self._echo_on is False:
+            _write_line(self.dmm_ser, cmd)
+        else:
+            _write_with_optional_echo(self.dmm_ser, cmd, timeout=self.ser_timeout)
+
+    # Initial wait for a query reply once the link is up. A responsive meter
+    # answers well within it; slower replies get the full ser_timeout.
+    _QUERY_TIMEOUT_S = 0.05
+
+    def _query(self, command: str, payload: Optional[bytes] = None) -> str:
+        """Send a query on an established link and return its reply line."""
+        return _query_with_optional_echo(
+            self.dmm_ser,
+            command,
+            timeout=self._QUERY_TIMEOUT_S,
+            payload=payload,
+            patience=self.ser_timeout,
+        )
+
     def get_id(self) -> bool:
         """
         Query *IDN? and record model string. Accepts any response containing '2831E'.
         """
         try:
-            line = _query_with_optional_echo(self.dmm_ser, "*IDN?", timeout=self.ser_timeout)
+            line = _query_with_optional_echo(
+                self.dmm_ser, _QRY_IDN, timeout=self.ser_timeout, payload=_CMD_IDN
+            )
         except Exception as e:
             self.log(f"DMM: ID query failed: {e}", status="ERROR")
             return False
 
         if not line:
             try:
-                line = _query_with_optional_echo(self.dmm_ser, "*IDN?", timeout=self.ser_timeout)
+                line = _query_with_optional_echo(
+                    self.dmm_ser, _QRY_IDN, timeout=self.ser_timeout, payload=_CMD_IDN
+                )
             except Exception as e:
                 self.log(f"DMM: ID query failed: {e}", status="ERROR")
                 return False
@@ -277,7 +429,7 @@ class BKP_2831E:
                 self.log("DMM: No response to *IDN?", status="ERROR")
                 return False
 
-        m = re.search(r"2831\s*E", line, re.IGNORECASE)
+        m = _IDN_RX.search(line)
         if not m:
             self.log(f"DMM: Unexpected ID string: {line!r}", status="ERROR")
             return False
@@ -287,102 +439,82 @@ class BKP_2831E:
 
     # --- function & range helpers ---
 
-    _SUPPORTED_FUNCS = {
+    # Interned so cached/normalized function names compare by identity first
+    _SUPPORTED_FUNCS = frozenset(map(sys.intern, (
         "volt:dc", "curr:dc",
         "volt:ac", "curr:ac",
         "res", "freq", "per", "temp",
+    )))
+
+    # function -> (cached-range attribute, SCPI range command)
+    _RANGE_SPEC = {
+        "volt:dc": ("voltage_range_dc", "VOLT:DC:RANG"),
+        "curr:dc": ("current_range_dc", "CURR:DC:RANG"),
+        "volt:ac": ("voltage_range_ac", "VOLT:AC:RANG"),
+        "curr:ac": ("current_range_ac", "CURR:AC:RANG"),
+        "res":     ("res_range",        "RES:RANG"),
+        "freq":    ("freq_range",       "FREQ:RANG"),
+    }
+    # Functions with manual ranges but no known-good RANG:AUTO command; an
+    # AUTO request for these is left alone rather than risk a -113 error
+    _NO_AUTO_RANGE = frozenset({"freq"})
+
+    # function -> SCPI subsystem prefix for REF commands
+    _REF_SUBSYS = {
+        "volt:dc": "VOLT:DC",
+        "curr:dc": "CURR:DC",
+        "res":     "RES",
+        "freq":    "FREQ",
+        "per":     "PER",
+    }
+
+    # function -> SCPI subsystem prefix for NPLC (AC/FREQ/PER have none)
+    _NPLC_SUBSYS = {
+        "volt:dc": "VOLT:DC",
+        "curr:dc": "CURR:DC",
+        "res":     "RES",
+        "temp":    "TEMP",
     }
 
     # --- reference subsystem ----------------------------------------------------
 
-    def enable_reference(self) -> bool:
+    def _send_ref(self, tail: str, what: str) -> bool:
         """
-        Enable reference for the current active function.
+        Send `<SUBSYS>:<tail>` for the active function's REF subsystem.
+        `what` names the public method for error logging.
         """
         func = (self.active_function or "").lower()
 
-        subsystem = {
-            "volt:dc": "VOLT:DC",
-            "curr:dc": "CURR:DC",
-            "res":     "RES",
-            "freq":    "FREQ",
-            "per":     "PER",
-        }.get(func)
+        subsystem = self._REF_SUBSYS.get(func)
 
         if subsystem is None:
             self.log("Reference not supported for this mode", status="WARNING")
             return False
 
         try:
-            _write_with_optional_echo(
-                self.dmm_ser,
-                f"{subsystem}:REF:STAT ON",
-                timeout=self.ser_timeout,
-            )
+            self._write_cmd(f"{subsystem}:{tail}")
             return True
         except Exception as e:
-            self.log(f"enable_reference failed: {e}", status="ERROR")
+            self.log(f"{what} failed: {e}", status="ERROR")
             return False
 
+    def enable_reference(self) -> bool:
+        """
+        Enable reference for the current active function.
+        """
+        return self._send_ref("REF:STAT ON", "enable_reference")
 
     def disable_reference(self) -> bool:
         """
         Disable reference for the active function.
         """
-        func = (self.active_function or "").lower()
-
-        subsystem = {
-            "volt:dc": "VOLT:DC",
-            "curr:dc": "CURR:DC",
-            "res":     "RES",
-            "freq":    "FREQ",
-            "per":     "PER",
-        }.get(func)
-
-        if subsystem is None:
-            self.log("Reference not supported for this mode", status="WARNING")
-            return False
-
-        try:
-            _write_with_optional_echo(
-                self.dmm_ser,
-                f"{subsystem}:REF:STAT OFF",
-                timeout=self.ser_timeout,
-            )
-            return True
-        except Exception as e:
-            self.log(f"disable_reference failed: {e}", status="ERROR")
-            return False
-
+        return self._send_ref("REF:STAT OFF", "disable_reference")
 
     def set_reference(self, value: float) -> bool:
         """
         Set the reference offset. Reference must already be enabled.
         """
-        func = (self.active_function or "").lower()
-
-        subsystem = {
-            "volt:dc": "VOLT:DC",
-            "curr:dc": "CURR:DC",
-            "res":     "RES",
-            "freq":    "FREQ",
-            "per":     "PER",
-        }.get(func)
-
-        if subsystem is None:
-            self.log("Reference not supported for this mode", status="WARNING")
-            return False
-
-        try:
-            _write_with_optional_echo(
-                self.dmm_ser,
-                f"{subsystem}:REF {value}",
-                timeout=self.ser_timeout,
-            )
-            return True
-        except Exception as e:
-            self.log(f"set_reference failed: {e}", status="ERROR")
-            return False
+        return self._send_ref(f"REF {value}", "set_reference")
 
     def get_reference(self) -> Optional[float]:
         """
@@ -391,23 +523,13 @@ class BKP_2831E:
         """
         func = (self.active_function or "").lower()
 
-        subsystem = {
-            "volt:dc": "VOLT:DC",
-            "curr:dc": "CURR:DC",
-            "res": "RES",
-            "freq": "FREQ",
-            "per": "PER",
-        }.get(func)
+        subsystem = self._REF_SUBSYS.get(func)
 
         if subsystem is None:
             return None
 
         try:
-            val = _query_with_optional_echo(
-                self.dmm_ser,
-                f"{subsystem}:REF?",
-                timeout=self.ser_timeout,
-            )
+            val = self._query(f"{subsystem}:REF?")
             return float(val)
         except Exception:
             return None
@@ -420,7 +542,7 @@ class BKP_2831E:
         func = (self.active_function or "").lower()
 
         # Only these functions support reference
-        if func not in ("volt:dc", "curr:dc", "res", "freq", "per"):
+        if func not in self._REF_SUBSYS:
             self.log("Reference acquire not supported for this mode", status="WARNING")
             return None
 
@@ -452,55 +574,104 @@ class BKP_2831E:
 
         return value
 
-    def _set_function(self, func: str) -> None:
-        # Normalize
-        f = func.strip().lower()
+    def _set_function(self, func: str, pending: Optional[list] = None) -> None:
+        """
+        Select the measurement function.
+
+        When `pending` is given, the SCPI command is appended to it instead of
+        being written, so the caller can send it as part of a compound command.
+        """
+        # Normalize (interned, see _SUPPORTED_FUNCS)
+        f = sys.intern(func.strip().lower())
         if self.active_function == f:
             return
         if f not in self._SUPPORTED_FUNCS:
             raise ValueError(f"Unsupported function {func}")
 
-        _write_with_optional_echo(self.dmm_ser, f"FUNC {f}", timeout=self.ser_timeout)
+        self._send_config(f"FUNC {f}", pending)
         self.active_function = f
 
-    def _set_range(self, f: str, rng: Optional[str]) -> None:
-        if not rng:
+    def _set_range(
+        self, f: str, rng: Union[str, float, None], pending: Optional[list] = None
+    ) -> None:
+        rng = _canon_range(rng)
+        if rng is None:
             return
-        f = f.strip().lower()
+        f = sys.intern(f.strip().lower())
         # Only set ranges that the instrument typically supports; ignore unknowns
-        if f == "volt:dc" and (self.active_function == f and self.voltage_range_dc != rng):
-            if rng == "AUTO":
-                _write_with_optional_echo(self.dmm_ser, f"VOLT:DC:RANG:AUTO 1", timeout=self.ser_timeout)
-            else:
-                _write_with_optional_echo(self.dmm_ser, f"VOLT:DC:RANG {rng}", timeout=self.ser_timeout)
-            self.voltage_range_dc = rng
-        elif f == "curr:dc" and (self.active_function == f and self.current_range_dc != rng):
-            if rng == "AUTO":
-                _write_with_optional_echo(self.dmm_ser, f"CURR:DC:RANG:AUTO 1", timeout=self.ser_timeout)
-            else:
-                _write_with_optional_echo(self.dmm_ser, f"CURR:DC:RANG {rng}", timeout=self.ser_timeout)
-            self.current_range_dc = rng
-        elif f == "volt:ac" and (self.active_function == f and self.voltage_range_ac != rng):
-            if rng == "AUTO":
-                _write_with_optional_echo(self.dmm_ser, f"VOLT:AC:RANG:AUTO 1", timeout=self.ser_timeout)
-            else:
-                _write_with_optional_echo(self.dmm_ser, f"VOLT:AC:RANG {rng}", timeout=self.ser_timeout)
-            self.voltage_range_ac = rng
-        elif f == "curr:ac" and (self.active_function == f and self.current_range_ac != rng):
-            if rng == "AUTO":
-                _write_with_optional_echo(self.dmm_ser, f"CURR:AC:RANG:AUTO 1", timeout=self.ser_timeout)
-            else:
-                _write_with_optional_echo(self.dmm_ser, f"CURR:AC:RANG {rng}", timeout=self.ser_timeout)
-            self.current_range_ac = rng
-        elif f == "res" and (self.active_function == f and self.res_range != rng):
-            _write_with_optional_echo(self.dmm_ser, f"RES:RANG {rng}", timeout=self.ser_timeout)
-            self.res_range = rng
-        elif f == "freq" and (self.active_function == f and self.freq_range != rng):
-            _write_with_optional_echo(self.dmm_ser, f"FREQ:RANG {rng}", timeout=self.ser_timeout)
-            self.freq_range = rng
-        elif f in {"per", "temp"}:
-            # Many meters are autorange for these; accept and ignore
-            pass
+        # (PER/TEMP are autorange on this meter and have no entry).
+        spec = self._RANGE_SPEC.get(f)
+        if spec is None or self.active_function != f:
+            return
+        attr, scpi = spec
+        if getattr(self, attr) == rng:
+            return  # cache hit; codes are canonical floats or interned keywords
+        if rng == "AUTO":
+            if f in self._NO_AUTO_RANGE:
+                return
+            cmd = f"{scpi}:AUTO 1"
+        elif isinstance(rng, str):
+            cmd = f"{scpi} {rng}"  # a SCPI keyword such as MAX/MIN
+        else:
+            cmd = f"{scpi} {rng:g}"
+        self._send_config(cmd, pending)
+        setattr(self, attr, rng)
+
+    def configure(
+        self,
+        func: str,
+        rng: Union[str, float, None] = None,
+        nplc: Optional[float] = None,
+    ) -> None:
+        """
+        Select function and (optionally) range and NPLC in a single SCPI
+        round-trip.
+        """
+        pending: list = []
+        self._set_function(func, pending)
+        self._set_range(func, rng, pending)
+        if nplc is not None:
+            self.set_nplc(nplc, pending)
+        if pending:
+            try:
+                self._write_compound(pending)
+            except Exception:
+                self._invalidate_config()
+                raise
+
+    def _send_config(self, cmd: str, pending: Optional[list]) -> None:
+        """Write a configuration command now, or queue it onto `pending`."""
+        if pending is None:
+            self._write_cmd(cmd)
+        else:
+            pending.append(cmd)
+
+    def _invalidate_config(self) -> None:
+        """
+        Forget cached function/range state after a failed compound command, so
+        the next measurement re-sends its configuration.
+        """
+        self.active_function = None
+        self.voltage_range_dc = None
+        self.current_range_dc = None
+        self.voltage_range_ac = None
+        self.current_range_ac = None
+        self.res_range = None
+        self.freq_range = None
+
+    def _write_compound(self, cmds: list) -> None:
+        """
+        Send several non-query commands as one `;:`-joined SCPI line and
+        discard a single echo. Throttled once for the whole batch. Falls back
+        to one line per command if the meter lacks compound support.
+        """
+        self._throttle()
+        if self._supports_compound:
+            self._write_cmd(_compound(cmds))
+        else:
+            for cmd in cmds:
+                self._write_cmd(cmd)
+        self._last_cmd_ns = _t.monotonic_ns()
 
     # --- trigger subsystem ---------------------------------------------------
 
@@ -529,13 +700,10 @@ class BKP_2831E:
             return False
 
         try:
-            _write_with_optional_echo(
-                self.dmm_ser,
-                f"TRIG:SOUR {scpi}",
-                timeout=self.ser_timeout,
-            )
+            self._write_cmd(f"TRIG:SOUR {scpi}")
             self.trigger_source = scpi
-            self.log(f"DMM: Trigger source set to {scpi}", status="DEBUG")
+            if self._debug_enabled():
+                self.log(f"DMM: Trigger source set to {scpi}", status="DEBUG")
             return True
         except Exception as e:
             self.log(f"DMM: set_trigger_source failed: {e}", status="ERROR")
@@ -549,11 +717,7 @@ class BKP_2831E:
             return self.trigger_source
 
         try:
-            line = _query_with_optional_echo(
-                self.dmm_ser,
-                "TRIG:SOUR?",
-                timeout=self.ser_timeout,
-            ).strip()
+            line = self._query(_QRY_TRIG_SOUR, payload=_CMD_TRIG_SOUR_Q).strip()
             if line:
                 self.trigger_source = line.upper()
             return self.trigger_source
@@ -572,21 +736,52 @@ class BKP_2831E:
             return False
 
         try:
-            _write_line(self.dmm_ser, "INIT")
-            _write_line(self.dmm_ser, "*TRG")
-            self.log("DMM: INIT + *TRG sent", status="DEBUG")
+            if self._supports_compound:
+                # One line, one write: "INIT;*TRG"
+                _write_bytes(self.dmm_ser, _CMD_INIT_TRG)
+            else:
+                # No compound support: one command per line
+                self._write_compound(["INIT", "*TRG"])
+            if self._debug_enabled():
+                self.log("DMM: INIT + *TRG sent", status="DEBUG")
             return True
         except Exception as e:
             self.log(f"DMM: trigger failed: {e}", status="ERROR")
             return False
 
-    def _fetch_number(self) -> float:
+    def trigger_read(self) -> float:
+        """
+        Fire a BUS trigger and fetch the reading it produced, in base units.
+        With compound support this is one line and one round-trip
+        ("INIT;*TRG;:FETCH?") instead of a trigger write plus a FETCH?.
+        """
+        if not self.dmm_ser:
+            raise RuntimeError("Serial not open")
+        if not self._supports_compound:
+            if not self.trigger():
+                raise RuntimeError("DMM: trigger failed")
+            return self._fetch_number()
+        return self._robust_fetch_float("INIT;*TRG;:FETCH?", payload=_CMD_INIT_TRG_FETCH)
+
+    def _fetch_number(self, pending: Optional[list] = None) -> float:
         """
         Robust numeric fetch with backoff, echo/garbage filtering, and line resets.
         Handles cases where the meter returns 'FETCH?' or 'FETC' (echo/partial),
         or other non-numeric garbage, without crashing.
+
+        Any queued configuration commands in `pending` are prepended to the
+        FETCH? so function/range changes and the fetch share one round-trip.
         """
-        return self._robust_fetch_float("FETCH?")
+        if not pending:
+            return self._robust_fetch_float("FETCH?", payload=_CMD_FETCH)
+        try:
+            if not self._supports_compound:
+                self._write_compound(pending)
+                return self._robust_fetch_float("FETCH?", payload=_CMD_FETCH)
+            return self._robust_fetch_float(_compound(pending + ["FETCH?"]))
+        except Exception:
+            self._invalidate_config()
+            raise
 
     def _ref_valid_range(self, func: str) -> Tuple[float, float]:
         """Return (min, max) valid REF range depending on function.
@@ -610,94 +805,144 @@ class BKP_2831E:
 
     # --- measurements (existing ones preserved exactly) ---
 
-    def read_dc_voltage(self, units: str = "V", rng: Optional[str] = None) -> float:
+    def read_dc_voltage(self, units: str = "V", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "volt:dc":
-            self._set_function("volt:dc")
-        if self.voltage_range_dc != rng:
-            self._set_range("volt:dc", rng)
+            self._set_function("volt:dc", pending)
+        self._set_range("volt:dc", rng, pending)
         try:
-            v = self._fetch_number()
+            v = self._fetch_number(pending)
         except Exception as e:
             self.log(f"DMM: read_dc_voltage failed: {e}", status="ERROR")
             raise
-        if units.lower() == "mv":
-            v *= 1000.0
-        return v
+        return v * _UNIT_MULT["volt:dc"].get(units.lower(), 1.0)
 
-    def read_dc_current(self, units: str = "A", rng: Optional[str] = None) -> float:
+    def read_dc_current(self, units: str = "A", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "curr:dc":
-            self._set_function("curr:dc")
-        if self.current_range_dc != rng:
-            self._set_range("curr:dc", rng)
+            self._set_function("curr:dc", pending)
+        self._set_range("curr:dc", rng, pending)
         try:
-            i = self._fetch_number()
+            i = self._fetch_number(pending)
         except Exception as e:
             self.log(f"DMM: read_dc_current failed: {e}", status="ERROR")
             raise
-        if units.lower() == "ma":
-            i *= 1000.0
-        return i
+        return i * _UNIT_MULT["curr:dc"].get(units.lower(), 1.0)
 
     # --- new measurement helpers ---
 
-    def read_ac_voltage(self, units: str = "V", rng: Optional[str] = None) -> float:
+    def read_ac_voltage(self, units: str = "V", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "volt:ac":
-            self._set_function("volt:ac")
-        if self.voltage_range_ac != rng:
-            self._set_range("volt:ac", rng)
-        v = self._fetch_number()
-        if units.lower() == "mv":
-            v *= 1000.0
-        return v
-
-    def read_ac_current(self, units: str = "A", rng: Optional[str] = None) -> float:
+            self._set_function("volt:ac", pending)
+        self._set_range("volt:ac", rng, pending)
+        v = self._fetch_number(pending)
+        return v * _UNIT_MULT["volt:ac"].get(units.lower(), 1.0)
+
+    def read_ac_current(self, units: str = "A", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "curr:ac":
-            self._set_function("curr:ac")
-        if self.current_range_ac != rng:
-            self._set_range("curr:ac", rng)
-        i = self._fetch_number()
-        if units.lower() == "ma":
-            i *= 1000.0
-        return i
-
-    def read_resistance(self, units: str = "ohm", rng: Optional[str] = None) -> float:
+            self._set_function("curr:ac", pending)
+        self._set_range("curr:ac", rng, pending)
+        i = self._fetch_number(pending)
+        return i * _UNIT_MULT["curr:ac"].get(units.lower(), 1.0)
+
+    def read_resistance(self, units: str = "ohm", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "res":
-            self._set_function("res")
-        if self.res_range != rng:
-            self._set_range("res", rng)
-        r = self._fetch_number()
+            self._set_function("res", pending)
+        self._set_range("res", rng, pending)
+        r = self._fetch_number(pending)
         # simple convenience: "kohm" / "mohm" supported
-        u = units.lower()
-        if u in ("kohm", "kΩ", "k"):
-            r /= 1e3
-        elif u in ("mohm", "mΩ", "m"):
-            r /= 1e6
-        return r
-
-    def read_frequency(self, units: str = "Hz", rng: Optional[str] = None) -> float:
+        return r * _UNIT_MULT["res"].get(units.lower(), 1.0)
+
+    def read_frequency(self, units: str = "Hz", rng: Union[str, float, None] = None) -> float:
+        pending: list = []
         if self.active_function != "freq":
-            self._set_function("freq")
-        if self.freq_range != rng:
-            self._set_range("freq", rng)
-        f = self._fetch_number()
-        if units.lower() in ("khz",):
-            f /= 1e3
-        elif units.lower() in ("mhz",):
-            f /= 1e6
-        return f
+            self._set_function("freq", pending)
+        self._set_range("freq", rng, pending)
+        f = self._fetch_number(pending)
+        return f * _UNIT_MULT["freq"].get(units.lower(), 1.0)
 
     def read_period(self, units: str = "s") -> float:
+        pending: list = []
         if self.active_function != "per":
-            self._set_function("per")
-        t = self._fetch_number()
-        if units.lower() in ("ms",):
-            t *= 1e3
-        elif units.lower() in ("us", "µs"):
-            t *= 1e6
-        return t
+            self._set_function("per", pending)
+        t = self._fetch_number(pending)
+        return t * _UNIT_MULT["per"].get(units.lower(), 1.0)
+
+    # Worst-case time per burst sample (slowest DC/AC rate is ~5 rdg/s;
+    # FREQ/PER at slow NPLC can be ~1 rdg/s)
+    _BURST_SAMPLE_TIME = 1.0
+
+    def read_burst(self, n: int, func: str = "volt:dc", rng: Union[str, float, None] = None) -> list:
+        """
+        Take `n` readings with one trigger sequence and one FETCH?.
+
+        Sends (in a single line) any needed FUNC/RANG changes, then
+        TRIG:COUN n; SAMP:COUN 1; INIT; FETCH?; TRIG:COUN 1 and parses the
+        comma-separated reply. Without compound support the same commands go
+        one per line, TRIG:COUN 1 after the reply. Readings are returned in
+        base units (V, A, ohm, Hz, s) as a list of floats.
+        """
+        n = int(n)
+        if n < 1:
+            raise ValueError("read_burst needs n >= 1")
+        f = func.strip().lower()
+
+        pending: list = []
+        self._set_function(f, pending)
+        self._set_range(f, rng, pending)
+        setup = pending + [f"TRIG:COUN {n}", "SAMP:COUN 1", "INIT"]
+        if self._supports_compound:
+            cmd, restore = _compound(setup + ["FETCH?", "TRIG:COUN 1"]), None
+        else:
+            cmd, restore = "FETCH?", "TRIG:COUN 1"
+        base = cmd.upper().encode("utf-8").rstrip(b"?")
+
+        self._throttle()
+        try:
+            if restore is not None:
+                # One command per line; each echo is consumed as it is sent
+                for c in setup:
+                    self._write_cmd(c)
+            _write_line(self.dmm_ser, cmd)
+        except Exception:
+            self._invalidate_config()
+            raise
+        self._last_cmd_ns = _t.monotonic_ns()
+
+        # The reply only comes once all n samples have been taken
+        t_end = _t.monotonic() + float(self.ser_timeout) + n * self._BURST_SAMPLE_TIME
+        buf = bytearray()
+        values: list = []
+        while len(values) < n:
+            for line in _drain_lines(self.dmm_ser, buf):
+                if line.upper().startswith(base):
+                    continue  # echo
+                values.extend(float(tok) for tok in _FLOAT_RX.findall(line))
+            if len(values) >= n:
+                break
+            if _t.monotonic() >= t_end:
+                break
+            # Each read waits at most one _PORT_TIMEOUT_S slice
+            buf += self.dmm_ser.read_until(b"\n")
+
+        if restore is not None:
+            try:
+                self._write_cmd(restore)
+            except Exception as e:
+                self.log(f"DMM: read_burst could not restore {restore}: {e}", status="WARNING")
+
+        if len(values) < n:
+            self._invalidate_config()
+            self._light_reset()
+            raise RuntimeError(f"DMM: burst returned {len(values)} of {n} readings")
+        self._error_streak = 0
+        return values[:n]
     
     def is_cooling(self) -> bool:
-        return _t.time() < getattr(self, "cooloff_until", 0.0)
+        return _t.monotonic_ns() < self.cooloff_until_ns
 
     def _light_reset(self) -> None:
         """Non-destructive link tidy-up: flush buffers; ignore exceptions."""
@@ -728,7 +973,59 @@ class BKP_2831E:
         finally:
             self._light_reset()
 
-    def _robust_fetch_float(self, cmd: str, retries: int = 3) -> float:
+    # Bounds for the adaptive command interval
+    _MIN_CMD_INTERVAL_NS = 5_000_000     # 5 ms
+    _MAX_CMD_INTERVAL_NS = 200_000_000   # 200 ms
+
+    def _seed_cmd_interval(self) -> None:
+        """
+        Reset the throttle to a baud-based estimate (~40 character times,
+        i.e. 400/baud seconds) and drop the measured round-trip history.
+        """
+        try:
+            est_ns = int(400.0 / float(self.baud) * 1e9)
+        except (TypeError, ValueError, ZeroDivisionError):
+            est_ns = 40_000_000
+        est_ns = max(self._MIN_CMD_INTERVAL_NS, min(self._MAX_CMD_INTERVAL_NS, est_ns))
+        self._base_cmd_interval_ns = est_ns
+        self._min_cmd_interval_ns = est_ns
+        self._avg_rtt_ns = None
+
+    def _note_fetch_ok(self, t_send_ns: int) -> None:
+        """
+        Record a successful fetch: fold its round-trip into the EWMA, retarget
+        the throttle to half the average RTT and decay any error backoff.
+        """
+        self._error_streak = 0
+        rtt = _t.monotonic_ns() - t_send_ns
+        if self._avg_rtt_ns is None:
+            self._avg_rtt_ns = float(rtt)
+        else:
+            self._avg_rtt_ns = 0.9 * self._avg_rtt_ns + 0.1 * rtt
+        self._base_cmd_interval_ns = max(
+            self._MIN_CMD_INTERVAL_NS, int(0.5 * self._avg_rtt_ns)
+        )
+        # Halve any backoff each success until we are back at the target
+        self._min_cmd_interval_ns = max(
+            self._base_cmd_interval_ns, self._min_cmd_interval_ns // 2
+        )
+
+    def _note_fetch_failed(self) -> None:
+        """Count a failed fetch attempt and double the throttle (capped)."""
+        self._error_streak += 1
+        self._min_cmd_interval_ns = min(
+            self._MAX_CMD_INTERVAL_NS, max(1, self._min_cmd_interval_ns) * 2
+        )
+
+    def _throttle(self) -> None:
+        """Sleep so consecutive commands are at least `_min_cmd_interval_ns` apart."""
+        wait_ns = self._min_cmd_interval_ns - (_t.monotonic_ns() - self._last_cmd_ns)
+        if wait_ns > 0:
+            _t.sleep(wait_ns / 1e9)
+
+    def _robust_fetch_float(
+        self, cmd: str, retries: int = 3, payload: Optional[bytes] = None
+    ) -> float:
         """
         Send `cmd` and reliably return a float.
         Strategy:
@@ -737,82 +1034,84 @@ class BKP_2831E:
           - try regex-based numeric extraction before giving up
           - on each failed attempt: light-reset + short backoff
           - after all retries: enter a cooloff + heavy reset and raise
+
+        `payload` is the pre-encoded wire form of `cmd`, if the caller has one.
         """
-        float_rx = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
-        base = cmd.strip().upper().rstrip("?")
+        if payload is None:
+            payload = _encode_line(cmd)
+        # Echo filtering works on raw bytes; replies are plain ASCII.
+        cmd_up = cmd.strip().upper().encode("utf-8")
+        base = cmd_up.rstrip(b"?")
 
         for attempt in range(retries):
             # --- throttle ---
-            now = _t.time()
-            dt = now - self._last_cmd_ts
-            if dt < self._min_cmd_interval:
-                _t.sleep(self._min_cmd_interval - dt)
+            self._throttle()
 
             # --- issue command ---
-            _write_line(self.dmm_ser, cmd)
-            self._last_cmd_ts = _t.time()
-
-            # --- read window: keep grabbing lines until timeout, filtering junk ---
-            t_end = _t.time() + max(0.15, float(self.ser_timeout))
-            while _t.time() < t_end:
-                line = _readline_text(self.dmm_ser, timeout=0.1)
-                if not line:
-                    continue
-                u = line.strip().upper()
-
-                # Skip exact or partial echoes like "FETCH?" / "FETC"
-                if u == cmd.strip().upper() or u.startswith(base):
-                    continue
-
-                # Try direct float
-                try:
-                    val = float(line.strip())
-                    self._error_streak = 0
-                    return val
-                except Exception:
-                    pass
-
-                # Try extracting first numeric token
-                m = float_rx.search(line)
-                if m:
-                    try:
-                        val = float(m.group(0))
-                        self._error_streak = 0
-                        return val
-                    except Exception:
-                        pass
-                # Otherwise keep reading within the window
+            _write_bytes(self.dmm_ser, payload)
+            t_send_ns = self._last_cmd_ns = _t.monotonic_ns()
+
+            # --- read window: drain what is already buffered, else block for more ---
+            t_end = _t.monotonic() + max(0.15, float(self.ser_timeout))
+            buf = bytearray()
+            while True:
+                for line in _drain_lines(self.dmm_ser, buf):
+                    u = line.upper()
+
+                    # Skip exact or partial echoes like "FETCH?" / "FETC"
+                    if u == cmd_up or u.startswith(base):
+                        continue
+
+                    # Line is exactly a number: the common case, no exception
+                    # on junk (float() accepts ASCII bytes)
+                    if _FLOAT_RX.fullmatch(line):
+                        self._note_fetch_ok(t_send_ns)
+                        return float(line)
+
+                    # A truncated or partial echo of a compound command (e.g.
+                    # "RANG 200;:FETC") is not a reading, though it has a number
+                    if u in cmd_up or b";" in u or b":" in u:
+                        continue
+
+                    # Try extracting first numeric token from a noisy line
+                    m = _FLOAT_RX.search(line)
+                    if m:
+                        self._note_fetch_ok(t_send_ns)
+                        return float(m.group(0))
+                    # Otherwise keep reading within the window
+
+                if _t.monotonic() >= t_end:
+                    break  # window expired with nothing usable from the meter
+                # Each read waits at most one _PORT_TIMEOUT_S slice
+                buf += self.dmm_ser.read_until(b"\n", 64)
 
             # --- attempt failed: light reset + backoff ---
-            self._error_streak += 1
+            self._note_fetch_failed()
             self._light_reset()
             _t.sleep(0.15 * (attempt + 1))
 
         # --- all retries failed: long cooloff + heavy reset, then raise ---
-        self.cooloff_until = _t.time() + 0.8 + 0.2 * min(self._error_streak, 3)
+        cooloff_s = 0.8 + 0.2 * min(self._error_streak, 3)
+        self.cooloff_until_ns = _t.monotonic_ns() + int(cooloff_s * 1e9)
         self._heavy_reset()
         raise RuntimeError("DMM: unable to fetch numeric value after retries")
 
-    def set_nplc(self, value: float) -> bool:
+    def set_nplc(self, value: float, pending: Optional[list] = None) -> bool:
         """
         Set NPLC for the *current* function, when supported.
         Supported: DCV (VOLT:DC), DCI (CURR:DC), RES, TEMP (if implemented).
         Returns True on success, False if unsupported or command fails.
+        With `pending`, the command is queued there instead (see _set_function).
         """
         func = (self.active_function or "").lower()
         # Map the active function to the SCPI subsystem used elsewhere in this driver
-        top = {
-            "volt:dc": "VOLT:DC",
-            "curr:dc": "CURR:DC",
-            "res":     "RES",
-            "temp":    "TEMP",
-        }.get(func)
+        top = self._NPLC_SUBSYS.get(func)
 
         if not top:
             return False  # AC/FREQ/PER typically don't support NPLC
 
         try:
-            _write_with_optional_echo(self.dmm_ser, f"{top}:NPLC {value}", timeout=self.ser_timeout)
+            self._send_config(f"{top}:NPLC {value}", pending)
             self._nplc_cache[func] = float(value)
             return True
         except Exception as e:
@@ -821,32 +1120,105 @@ class BKP_2831E:
 
 # ---- small IO helpers --------------------------------------------------------
 
-def _write_line(ser, text: str) -> None:
+# Pre-encoded payloads for the fixed, frequently sent commands
+_CMD_FETCH = b"FETCH?\n"
+_CMD_TRG = b"*TRG\n"
+_CMD_INIT_TRG = b"INIT;*TRG\n"
+_CMD_INIT_TRG_FETCH = b"INIT;*TRG;:FETCH?\n"
+_CMD_IDN = b"*IDN?\n"
+_CMD_RST = b"*RST\n"
+_CMD_TRIG_SOUR_Q = b"TRIG:SOUR?\n"
+_CMD_COMPOUND_PROBE = b"TRIG:SOUR?;:TRIG:SOUR?\n"
+
+# Query verbs, kept as constants so their normalised echo form stays cached
+_QRY_IDN = "*IDN?"
+_QRY_TRIG_SOUR = "TRIG:SOUR?"
+_QRY_COMPOUND_PROBE = "TRIG:SOUR?;:TRIG:SOUR?"
+
+def _encode_line(text: str) -> bytes:
+    return (text.strip() + "\n").encode("utf-8")
+
+def _write_bytes(ser, payload: bytes) -> None:
+    """Write an already-encoded, newline-terminated command."""
     if not ser:
         raise RuntimeError("Serial not open")
-    payload = (text.strip() + "\n").encode("utf-8")
     ser.write(payload)
     try:
         ser.flush()
     except Exception:
         pass
 
-def _readline_text(ser, timeout: float = 1.0) -> str:
+def _write_line(ser, text: str) -> None:
+    _write_bytes(ser, _encode_line(text))
+
+def _canon_range(rng: Union[str, float, None]) -> Union[str, float, None]:
+    """
+    Canonical form of a range code: numbers as float ("2e3 " -> 2000.0),
+    keywords such as AUTO as interned upper-case strings; None if unset.
+    """
+    if rng is None or isinstance(rng, float):
+        return rng
+    if isinstance(rng, int):
+        return float(rng)
+    rng = rng.strip()
+    if not rng:
+        return None
+    try:
+        return float(rng)
+    except ValueError:
+        return sys.intern(rng.upper())
+
+def _compound(cmds) -> str:
+    """Join SCPI commands into one line, re-rooting each with ':'."""
+    return ";:".join(c.strip().lstrip(":") for c in cmds)
+
+# Fixed port read timeout, set once when the port is opened. Reads wait in
+# slices of this length and enforce their own deadlines with monotonic(),
+# because every assignment to `ser.timeout` reconfigures the port.
+_PORT_TIMEOUT_S = 0.05
+
+def _drain_lines(ser, buf: bytearray) -> list:
+    """
+    Move any bytes already waiting on `ser` into `buf` without blocking, and
+    return the complete lines in it as stripped `bytes` (blanks dropped).
+    A trailing partial line is left in `buf` for the next call.
+    """
+    n = getattr(ser, "in_waiting", 0)
+    if n:
+        buf += ser.read(n)
+    if b"\n" not in buf:
+        return []
+    head, _, _ = buf.rpartition(b"\n")
+    del buf[:len(head) + 1]
+    lines = []
+    for raw in head.split(b"\n"):
+        line = bytes(raw.strip())
+        if line:
+            lines.append(line)
+    return lines
+
+def _readline_bytes(
+    ser, timeout: Optional[float] = 1.0, patience: Optional[float] = None
+) -> bytes:
+    """
+    Read one line with pySerial's read_until (which returns as soon as the
+    newline arrives), and return it as `bytes` with surrounding
+    whitespace/CRLF stripped. Gives up `timeout` seconds in.
+
+    `patience`, if given, is extra time allowed when the line has not
+    completed within `timeout`. That allows a short first wait without
+    cutting a slow reply in half and leaving its tail in the buffer.
+
+    The port keeps its fixed _PORT_TIMEOUT_S; the deadline is checked here
+    between reads. timeout=None waits a single read.
+    """
     if not ser:
         raise RuntimeError("Serial not open")
-    t0 = time.time()
-    while True:
-        line = ser.readline()
-        if line:
-            try:
-                return line.decode("utf-8", "ignore").strip()
-            except Exception:
-                return str(line).strip()
-        if timeout is None:
-            break
-        if (time.time() - t0) >= max(0.0, timeout):
-            break
-    return ""
+    deadline = _t.monotonic() + (timeout or 0.0) + (patience or 0.0)
+    line = ser.read_until(b"\n")
+    while not line.endswith(b"\n") and _t.monotonic() < deadline:
+        line += ser.read_until(b"\n")
+    return bytes(line.strip()) if line else b""
 
 def _write_with_optional_echo(ser, text: str, timeout: float = 0.1) -> None:
     """
@@ -859,39 +1231,98 @@ def _write_with_optional_echo(ser, text: str, timeout: float = 0.1) -> None:
 
     _write_line(ser, text)
     # Read and ignore a single possible echo; short timeout so we don't stall
-    _readline_text(ser, timeout=timeout)
-
-def _query_with_optional_echo(ser, command: str, timeout: float = 1.0) -> str:
+    _readline_bytes(ser, timeout=timeout)
+
+@functools.lru_cache(maxsize=64)
+def _norm_cmd(command: str) -> bytes:
+    """Canonical (stripped, upper-case, encoded) form of a command for echo matching."""
+    return command.strip().upper().encode("utf-8")
+
+def _query_with_optional_echo(
+    ser,
+    command: str,
+    timeout: float = 1.0,
+    payload: Optional[bytes] = None,
+    patience: Optional[float] = None,
+) -> str:
     """
     Send a SCPI query and return the first non-echo line (handles SYS:RETURN ON/OFF).
+    `payload` optionally supplies the pre-encoded form of `command`;
+    `patience` is passed to each line read (see _readline_bytes).
     """
     if not ser:
         raise RuntimeError("Serial not open")
 
-    _write_line(ser, command)
-    line = _readline_text(ser, timeout=timeout)
-    if line and line.strip().upper() == command.strip().upper():
-        line = _readline_text(ser, timeout=timeout)
-    return line or ""
+    _write_bytes(ser, payload if payload is not None else _encode_line(command))
+    # Echo check stays in bytes; only the reply that is returned is decoded
+    line = _readline_bytes(ser, timeout=timeout, patience=patience)
+    if line:
+        # _readline_bytes already strips; only upper-case when lengths agree
+        norm = _norm_cmd(command)
+        if len(line) == len(norm) and line.upper() == norm:
+            line = _readline_bytes(ser, timeout=timeout, patience=patience)
+    return line.decode("utf-8", "ignore") if line else ""
+
+_PORT_INFO_FIELDS = ("description", "manufacturer", "hwid")
 
 def _is_cp210x_port(info) -> bool:
     try:
-        desc = getattr(info, "description", "") or ""
-        manu = getattr(info, "manufacturer", "") or ""
-        hwid = getattr(info, "hwid", "") or ""
+        text = " ".join(getattr(info, k, "") or "" for k in _PORT_INFO_FIELDS).upper()
     except Exception:
         return False
-    text = f"{desc} {manu} {hwid}".upper()
-    if "CP210" in text:
-        return True
-    if "SILICON LABS" in text and "UART" in text:
-        return True
-    return False
+    return "CP210" in text or ("SILICON LABS" in text and "UART" in text)
 
 # ---- GUI ---------------------------------------------------------------------
 
 import tkinter as tk
-from tkinter import font, messagebox
+from tkinter import font, messagebox, ttk
+
+# Datasheet reading rates (readings/sec) as (slow, med, fast), for GUI
+# pacing only. Temperature is treated like DC in terms of update feel.
+_RATE_TABLE = {
+    "volt:dc":  (5.0, 10.0, 25.0),
+    "curr:dc":  (5.0, 10.0, 25.0),
+    "volt:ac":  (5.0, 10.0, 25.0),
+    "curr:ac":  (5.0, 10.0, 25.0),
+    "temp":     (5.0, 10.0, 25.0),
+    "res_low":  (5.0, 10.0, 25.0),   # Ω below 20 MΩ
+    "res_high": (1.3, 2.6, 5.6),     # Ω at 20 MΩ and above
+    "freq":     (1.0, 2.0, 3.9),
+    "per":      (1.0, 2.0, 3.9),
+}
+
+# SCPI overflow value the meter returns for an overload / open input
+_OVERLOAD = 9.9e37
+_OL_TEXT = "%12s" % "OL"
+
+@functools.lru_cache(maxsize=2048)
+def _fmt_value_cached(value: float) -> str:
+    return "%12.6g" % value
+
+def _fmt_value(value: float) -> str:
+    """
+    Display text for a reading. The meter replies with a fixed number of
+    digits, so a steady signal parses to the very same float every time and
+    the raw value is a good cache key (no rounding needed). Zero bypasses
+    the cache: 0.0 and -0.0 are equal keys but format differently.
+    """
+    if value == 0.0:
+        return "%12.6g" % value
+    return _fmt_value_cached(value)
+
+# Unknown function -> original fixed pacing (~200 ms)
+_DEFAULT_DELAY_MS = 200
+
+# (rate key, NPLC index) -> delay in ms, clamped to 50–1200 ms. NPLC index
+# 0 (0.1 PLC) -> fast, 1 (1 PLC) -> med, 2 (10 PLC) -> slow.
+_DELAY_MS_TABLE = {
+    (key, nplc_idx): max(50, min(1200, int(1000.0 / rates[2 - nplc_idx])))
+    for key, rates in _RATE_TABLE.items()
+    for nplc_idx in (0, 1, 2)
+}
+
+# One front-panel function; DmmGui.modes is a tuple of these
+_Mode = collections.namedtuple("_Mode", "label func units ranges reader")
 
 class DmmGui:
     """
@@ -903,6 +1334,49 @@ class DmmGui:
     - Status bar at the bottom
     """
 
+    # func -> (driver method, units override or None for the mode's units)
+    _READER_SPEC = {
+        "volt:dc": ("read_dc_voltage", None),
+        "curr:dc": ("read_dc_current", None),
+        "volt:ac": ("read_ac_voltage", None),
+        "curr:ac": ("read_ac_current", None),
+        "res":     ("read_resistance", "ohm"),
+        "freq":    ("read_frequency", "Hz"),
+        "per":     ("read_period", "s"),
+    }
+
+    # units -> (scale, shown units), largest first, for engineering display
+    _ENG_UNITS = {
+        "Ω": ((1e6, "MΩ"), (1e3, "kΩ"), (1.0, "Ω")),
+    }
+
+    @classmethod
+    def _make_formatter(cls, units: str):
+        """
+        Build a mode's display formatter: value -> (value text, units text).
+        Number formatting goes through the cached _fmt_value. The meter's
+        overload reading (±9.9E37, e.g. an open circuit on Ω) shows as "OL"
+        and is never scaled.
+        """
+        fmt = _fmt_value
+        steps = cls._ENG_UNITS.get(units)
+        if steps is None:
+            def plain(value):
+                if abs(value) >= _OVERLOAD:
+                    return _OL_TEXT, units
+                return fmt(value), units
+            return plain
+
+        def eng(value):
+            mag = abs(value)
+            if mag >= _OVERLOAD:
+                return _OL_TEXT, units
+            for scale, shown in steps:
+                if mag >= scale:
+                    return fmt(value / scale), shown
+            return fmt(value), units
+        return eng
+
     def __init__(self, root: tk.Tk, dmm: 'BKP_2831E' = None) -> None:
         self.root = root
         self.dmm = dmm or BKP_2831E()
@@ -1007,35 +1481,137 @@ class DmmGui:
                 "reader": lambda: self.dmm.read_period("s") if hasattr(self.dmm, "read_period") else None,
             },
         ]
+        # Frozen once: attribute access, and nothing can edit the table later
+        self.modes = tuple(_Mode(**m) for m in self.modes)
         self.current_mode_index = 0
-        self.mode_buttons = {}
+        self.mode_buttons = [None] * len(self.modes)  # index -> Button
+        self._shown_mode_index = None  # mode whose button is drawn pressed
 
         # NPLC support (only for these modes/functions)
         self._nplc_supported = {"volt:dc", "curr:dc", "res", "temp"}
         self._nplc_options = [0.1, 1, 10]  # three choices
         self._nplc_index_per_mode = [1] * len(self.modes)  # default to 1 PLC
+        self._last_nplc_state = (None, None)  # (supported, selection) drawn
+
+        # Hot paths index these flat per-mode lists instead of the mode dicts
+        self._mode_funcs = [m.func for m in self.modes]
+        self._mode_units = [m.units for m in self.modes]
+        # Range codes parsed once: float for a manual range, "AUTO" otherwise
+        self._mode_ranges = [
+            [
+                (label, "AUTO" if code in (None, "AUTO") else float(code))
+                for label, code in (m.ranges or [("AUTO", None)])
+            ]
+            for m in self.modes
+        ]
+        self._mode_fmts = [self._make_formatter(u) for u in self._mode_units]
+        # _RATE_TABLE key per (mode, range): resistance splits on the slower
+        # high-ohm (20 MΩ) range, other functions use their own name
+        self._mode_rate_keys = [
+            [
+                ("res_high" if "20 m" in label.lower() or code == 20e6 else "res_low")
+                if func == "res" else func
+                for label, code in ranges
+            ]
+            for func, ranges in zip(self._mode_funcs, self._mode_ranges)
+        ]
+        # Bit i set <=> mode i takes NPLC
+        self._nplc_mask = sum(
+            1 << i for i, f in enumerate(self._mode_funcs) if f in self._nplc_supported
+        )
+
+        # Per-mode reader dispatch, resolved once: (bound method, kwargs), or
+        # None where the driver lacks the reader.
+        self._mode_readers = []
+        for func, units in zip(self._mode_funcs, self._mode_units):
+            spec = self._READER_SPEC.get(func)
+            fn = getattr(self.dmm, spec[0], None) if spec else None
+            self._mode_readers.append(
+                (fn, {"units": spec[1] or units}) if fn is not None else None
+            )
 
         # Per-mode range index (0 = AUTO by convention)
         self.range_index_per_mode = [0] * len(self.modes)
+        self._range_commit_id = None  # pending debounced range write (after id)
+        self._ports_cache = None      # (monotonic time, ports) from list_candidate_ports
 
         # Tk variables
         self.value_var    = tk.StringVar(value="------")
-        self.unit_var     = tk.StringVar(value=self.modes[0]["units"])
-        self.function_var = tk.StringVar(value=self.modes[0]["func"])
+        self.unit_var     = tk.StringVar(value=self.modes[0].units)
+        self.function_var = tk.StringVar(value=self.modes[0].func)
         self.range_var    = tk.StringVar(value="Range: AUTO")
         self.status_var   = tk.StringVar(value="")
+        # Last string pushed into each display var (see _set_var)
+        self._var_cache = {}
+        self._pending_render = (None, None)  # (value, error) for _do_render
+        self._render_pending = False         # _do_render queued via after_idle
+        self._after_id = None                # pending _drain_and_render after()
+        self._shutting_down = False          # set by on_closing; stops re-arming
+        self._cooling_shown = False          # status bar shows _COOLING_MSG
+        # Tk calls made every poll/render, bound once
+        self._after = self.root.after
+        self._after_idle = self.root.after_idle
+        self._update_idletasks = self.root.update_idletasks
+        self._drain_cb = self._drain_and_render
+        self._do_render_cb = self._do_render
         self.trigger_source_var = tk.StringVar(value="IMM")
         self.ref_enabled = False
         self.ref_entry_var = tk.StringVar()
+        self.connected = False
+
+        # Serial I/O runs on a worker thread; Tk only drains finished readings
+        # and hands other driver calls over through _submit. Every driver call
+        # must hold _dmm_lock.
+        self._dmm_lock = threading.RLock()
+        self._read_q = queue.Queue(maxsize=2)    # (seq, mode_index, value, ts, error)
+        self._req_seq = 0                        # bumped when readings go stale
+        self._trigger_pending = False            # next read is a BUS trigger+fetch
+        self._cfg_pending = False                # reader must run _sync_config first
+        self._jobs = queue.Queue()               # (fn, done) from _submit
+        self._job_results = queue.Queue()        # (done, result, error) for Tk
+        self._wake_evt = threading.Event()       # cut the worker's wait short
+        self._stop_evt = threading.Event()       # ask the worker to exit
+        # Bound once; both loops ask it every cycle
+        self._is_cooling = getattr(self.dmm, "is_cooling", lambda: False)
+        self._reset_instr_state()                # _instr_state: under _dmm_lock
+
+        # Upper bound on display refresh; the reader also never outpaces the
+        # meter's datasheet rate (_compute_update_delay_ms).
+        self.target_fps = 10
+        self._steady_count = 0      # consecutive unchanged readings (reader thread)
+        self._last_reading = None   # (mode_index, value) of the previous reading
+        # (mode, NPLC index, range index) -> pacing delay in ms; a few dozen keys at most
+        self._delay_cache = {}
+
+        # Last session's choices (baud, mode, NPLC, port), if any
+        self._saved_port = None
+        self._restore_settings()
 
         self._build_ui()
         #self._connect_to_dmm()
         self._apply_mode(self.current_mode_index)
-        self._schedule_update()
+
+        # Reconnect straight away if last session's port is still present
+        if self._saved_port and self._saved_port in self.list_candidate_ports():
+            self.port_var.set(self._saved_port)
+            self.root.after_idle(self._connect_to_dmm)
+
+        self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+        self._reader_thread.start()
+        self._drain_and_render()
 
     # ---------- UI ----------
 
+    def _init_styles(self) -> None:
+        """Shared styling for the dark control rows (frames and labels)."""
+        style = ttk.Style(self.root)
+        style.configure("Dark.TFrame", background="#202020")
+        style.configure("Dark.TLabel", background="#202020", foreground="white")
+        style.configure("Bold.Dark.TLabel", font=("Helvetica", 10, "bold"))
+
     def _build_ui(self) -> None:
+        self._init_styles()
+
         # ─────────────────────────────────────────────────────────────
         # Main Shell
         # ─────────────────────────────────────────────────────────────
@@ -1140,15 +1716,13 @@ class DmmGui:
         # ─────────────────────────────────────────────────────────────
         # Row 1 — NPLC + Trigger row
         # ─────────────────────────────────────────────────────────────
-        nplc_row = tk.Frame(main, bg="#202020")
+        nplc_row = ttk.Frame(main, style="Dark.TFrame")
         nplc_row.grid(row=1, column=0, columnspan=3, sticky="we", pady=(10, 4))
 
-        tk.Label(
+        ttk.Label(
             nplc_row,
             text="Integration Time (NPLC):",
-            bg="#202020",
-            fg="white",
-            font=("Helvetica", 10, "bold")
+            style="Bold.Dark.TLabel",
         ).pack(side="left", padx=(4, 10))
 
         # NPLC buttons
@@ -1164,15 +1738,13 @@ class DmmGui:
             self._nplc_buttons.append(b)
 
         # ---- Trigger controls ----
-        trig_frame = tk.Frame(nplc_row, bg="#202020")
+        trig_frame = ttk.Frame(nplc_row, style="Dark.TFrame")
         trig_frame.pack(side="right", padx=(10, 4))
 
-        tk.Label(
+        ttk.Label(
             trig_frame,
             text="Trig:",
-            bg="#202020",
-            fg="white",
-            font=("Helvetica", 10, "bold"),
+            style="Bold.Dark.TLabel",
         ).pack(side="left", padx=(0, 4))
 
         trig_sources = ["IMM", "BUS", "MAN"]
@@ -1195,7 +1767,7 @@ class DmmGui:
         # ─────────────────────────────────────────────────────────────
         # Row 2 — REF toggle + entry on the SAME row
         # ─────────────────────────────────────────────────────────────
-        ref_row = tk.Frame(main, bg="#202020")
+        ref_row = ttk.Frame(main, style="Dark.TFrame")
         ref_row.grid(row=2, column=0, columnspan=3, sticky="we", pady=(4, 6))
 
         # REF toggle button
@@ -1209,15 +1781,14 @@ class DmmGui:
         self.ref_button.grid(row=0, column=0, padx=6, sticky="w")
 
         # Reference controls frame (hidden by default), same row, next column
-        self.ref_frame = tk.Frame(ref_row, bg="#202020")
+        self.ref_frame = ttk.Frame(ref_row, style="Dark.TFrame")
         self.ref_frame.grid(row=0, column=1, sticky="w", padx=(8, 0))
         self.ref_frame.grid_remove()  # start hidden
 
-        tk.Label(
+        ttk.Label(
             self.ref_frame,
             text="Reference:",
-            bg="#202020",
-            fg="white",
+            style="Dark.TLabel",
         ).pack(side="left", padx=4)
 
         self.ref_entry = tk.Entry(
@@ -1244,15 +1815,14 @@ class DmmGui:
         # ─────────────────────────────────────────────────────────────
         # Row 4 — Status + Baud + Connect/Quit
         # ─────────────────────────────────────────────────────────────
-        status_row = tk.Frame(main, bg="#202020")
+        status_row = ttk.Frame(main, style="Dark.TFrame")
         status_row.grid(row=4, column=0, columnspan=3, sticky="we", pady=(10, 0))
 
-        tk.Label(
+        ttk.Label(
             status_row,
             textvariable=self.status_var,
             anchor="w",
-            bg="#202020",
-            fg="white"
+            style="Dark.TLabel",
         ).pack(side="left")
 
         tk.Button(
@@ -1271,33 +1841,27 @@ class DmmGui:
         ).pack(side="right", padx=12)
 
         # Port selector
-        port_frame = tk.Frame(status_row, bg="#202020")
+        port_frame = ttk.Frame(status_row, style="Dark.TFrame")
         port_frame.pack(side="right", padx=(6, 0))
 
-        tk.Label(port_frame, text="Port:", bg="#202020", fg="white").pack(side="left")
+        ttk.Label(port_frame, text="Port:", style="Dark.TLabel").pack(side="left")
 
-        try:
-            ports = self.list_candidate_ports()
-        except Exception:
-            ports = []
-
-        # "Auto" means "let driver pick CP210x / first port"
-        if ports:
-            port_values = ["Auto"] + ports
-        else:
-            port_values = ["Auto"]
+        # "Auto" means "let driver pick CP210x / first port". The real port
+        # list is filled in when the menu is opened (_refresh_ports_menu).
+        self.port_var = tk.StringVar(value="Auto")
+        self._port_menu_ports = None  # ports the menu currently lists
 
-        self.port_var = tk.StringVar(value=port_values[0])
-
-        port_menu = tk.OptionMenu(port_frame, self.port_var, *port_values)
-        port_menu.config(width=8)
-        port_menu.pack(side="left", padx=(2, 0))
+        self.port_menu = tk.OptionMenu(port_frame, self.port_var, "Auto")
+        self.port_menu.config(width=8)
+        self.port_menu.pack(side="left", padx=(2, 0))
+        # Widget bindings run before the class binding that posts the menu
+        self.port_menu.bind("<Button-1>", self._refresh_ports_menu)
 
         # Baud rate
-        baud_frame = tk.Frame(status_row, bg="#202020")
+        baud_frame = ttk.Frame(status_row, style="Dark.TFrame")
         baud_frame.pack(side="right", padx=(6, 0))
 
-        tk.Label(baud_frame, text="Baud:", bg="#202020", fg="white").pack(side="left")
+        ttk.Label(baud_frame, text="Baud:", style="Dark.TLabel").pack(side="left")
 
         baud_values = ["600", "1200", "2400", "4800", "9600", "19200", "38400"]
         self.baud_var = tk.StringVar(value=str(self.dmm.baud))
@@ -1334,20 +1898,23 @@ class DmmGui:
 
     # ---------- trigger helpers ----------
 
-    def _apply_trigger_source_to_instrument(self) -> None:
+    def _apply_trigger_source_to_instrument(self, report: bool = True) -> None:
         """
         Push the GUI trigger source into the instrument, if supported.
+        With report=False only a failure is shown in the status bar.
         """
         if not getattr(self, "connected", False):
             return
 
         src = self.trigger_source_var.get()
         if hasattr(self.dmm, "set_trigger_source"):
-            ok = self.dmm.set_trigger_source(src)
-            if not ok:
-                self.status_var.set(f"Failed to set trigger source to {src}")
-            else:
-                self.status_var.set(f"Trigger source: {src}")
+            def done(ok, error):
+                if not ok:
+                    self._set_var(self.status_var, f"Failed to set trigger source to {src}")
+                elif report:
+                    self._set_var(self.status_var, f"Trigger source: {src}")
+
+            self._submit(lambda: self.dmm.set_trigger_source(src), done)
 
     def _on_trigger_source_change(self, value: str) -> None:
         """
@@ -1362,46 +1929,60 @@ class DmmGui:
         Typically useful when TRIG:SOUR BUS is selected.
         """
         if not getattr(self, "connected", False):
-            self.status_var.set("Not connected.")
+            self._set_var(self.status_var, "Not connected.")
             return
 
-        # Make sure the meter knows our selected trigger source
-        self._apply_trigger_source_to_instrument()
+        # Make sure the meter knows our selected trigger source (queued
+        # ahead of the trigger itself)
+        self._apply_trigger_source_to_instrument(report=False)
+
+        # BUS: let the reader fire the trigger and fetch its reading in one
+        # round-trip rather than writing *TRG here and fetching later
+        if self.trigger_source_var.get() == "BUS" and hasattr(self.dmm, "trigger_read"):
+            self._trigger_pending = True
+            self._wake_evt.set()
+            self._set_var(self.status_var, "Trigger sent (BUS)")
+            return
 
         # Ask the driver to issue a BUS trigger
-        try:
-            if hasattr(self.dmm, "trigger"):
-                ok = self.dmm.trigger()
-                if ok:
-                    self.status_var.set(
-                        f"Trigger sent ({self.trigger_source_var.get()})"
-                    )
+        src = self.trigger_source_var.get()
+        if hasattr(self.dmm, "trigger"):
+            def done(ok, error):
+                if error:
+                    self._set_var(self.status_var, f"Trigger error: {error}")
+                elif ok:
+                    self._set_var(self.status_var, f"Trigger sent ({src})")
+                    self._wake_evt.set()  # fetch the triggered reading now
                 else:
-                    self.status_var.set("Trigger failed.")
-            else:
-                # Very old driver; best-effort fallback using module helper
-                try:
-                    _write_line(self.dmm.dmm_ser, "*TRG")
-                    self.status_var.set(
-                        f"Trigger (*TRG) sent ({self.trigger_source_var.get()})"
-                    )
-                except Exception as e:
-                    self.status_var.set(f"Trigger error: {e}")
-        except Exception as e:
-            self.status_var.set(f"Trigger error: {e}")
+                    self._set_var(self.status_var, "Trigger failed.")
+
+            self._submit(self.dmm.trigger, done)
+        else:
+            # Very old driver; best-effort fallback using module helper
+            def done(_, error):
+                if error:
+                    self._set_var(self.status_var, f"Trigger error: {error}")
+                else:
+                    self._set_var(self.status_var, f"Trigger (*TRG) sent ({src})")
+
+            self._submit(lambda: _write_bytes(self.dmm.dmm_ser, _CMD_TRG), done)
  
     # ---------- nplc helpers ----------
 
     def _update_nplc_buttons(self) -> None:
         """Enable/disable + highlight NPLC buttons depending on function support."""
-        func = self.modes[self.current_mode_index]["func"]
-        supported = func in self._nplc_supported
+        index = self.current_mode_index
+        supported = (self._nplc_mask >> index) & 1
+        # visual selection for current per-mode choice
+        sel = self._nplc_index_per_mode[index]
+        # Each configure() is a Tcl round-trip; skip if nothing would change
+        if (supported, sel) == self._last_nplc_state:
+            return
+        self._last_nplc_state = (supported, sel)
         for i, b in enumerate(self._nplc_buttons):
             if not supported:
                 b.configure(state="disabled", relief="raised")
             else:
-                # visual selection for current per-mode choice
-                sel = self._nplc_index_per_mode[self.current_mode_index]
                 if i == sel:
                     b.configure(state="normal", relief="sunken")
                 else:
@@ -1409,49 +1990,55 @@ class DmmGui:
 
     def _on_nplc(self, idx: int) -> None:
         """Set NPLC if supported for current function; remember per-mode selection."""
-        func = self.modes[self.current_mode_index]["func"]
-        if func not in self._nplc_supported:
+        if not (self._nplc_mask >> self.current_mode_index) & 1:
             return
 
         self._nplc_index_per_mode[self.current_mode_index] = idx
         self._update_nplc_buttons()
 
         if not getattr(self, "connected", False):
-            self.status_var.set("Not connected.")
+            self._set_var(self.status_var, "Not connected.")
             return
 
-        val = self._nplc_options[idx]
-        try:
-            ok = getattr(self.dmm, "set_nplc", lambda _v: False)(val)
-            if ok:
-                self.status_var.set(f"NPLC set to {val:g}")
-            else:
-                self.status_var.set("NPLC not supported for this mode.")
-        except Exception as e:
-            self.status_var.set(f"NPLC error: {e}")
+        # The reader pushes it before its next read; errors show as read errors
+        self._request_config()
+        self._set_var(self.status_var, f"NPLC set to {self._nplc_options[idx]:g}")
 
     # ---------- range helpers ----------
 
-    def _get_current_range_tuple(self):
-        """Return (label, code) for the current mode's range."""
-        mode = self.modes[self.current_mode_index]
-        ranges = mode.get("ranges") or [("AUTO", None)]
-        idx = self.range_index_per_mode[self.current_mode_index]
+    def _get_current_range_tuple(self, index: Optional[int] = None):
+        """Return (label, code) for the current (or given) mode's range."""
+        if index is None:
+            index = self.current_mode_index
+        ranges = self._mode_ranges[index]
+        idx = self.range_index_per_mode[index]
         if idx < 0 or idx >= len(ranges):
             idx = 0
-            self.range_index_per_mode[self.current_mode_index] = 0
+            self.range_index_per_mode[index] = 0
         return ranges[idx]
 
-    def _get_current_range_code(self):
-        return self._get_current_range_tuple()[1]
+    def _get_current_range_code(self, index: Optional[int] = None):
+        return self._get_current_range_tuple(index)[1]
+
+    def _set_var(self, var, text: str) -> bool:
+        """
+        Set a display StringVar only if its text changed; True if it did.
+        Every set() fires Tk traces and a redraw, even for identical text.
+        """
+        key = str(var)
+        if self._var_cache.get(key) == text:
+            return False
+        self._var_cache[key] = text
+        var.set(text)
+        return True
 
     def _update_range_display(self):
         label, _ = self._get_current_range_tuple()
-        self.range_var.set(f"Range: {label}")
+        self._set_var(self.range_var, f"Range: {label}")
 
     def _range_up(self):
         idx_mode = self.current_mode_index
-        ranges = self.modes[idx_mode].get("ranges") or [("AUTO", None)]
+        ranges = self._mode_ranges[idx_mode]
         if len(ranges) <= 1:
             return  # nothing to do
         cur = self.range_index_per_mode[idx_mode]
@@ -1461,10 +2048,11 @@ class DmmGui:
             cur += 1
         self.range_index_per_mode[idx_mode] = cur
         self._update_range_display()
+        self._schedule_range_commit()
 
     def _range_down(self):
         idx_mode = self.current_mode_index
-        ranges = self.modes[idx_mode].get("ranges") or [("AUTO", None)]
+        ranges = self._mode_ranges[idx_mode]
         if len(ranges) <= 1:
             return
         cur = self.range_index_per_mode[idx_mode]
@@ -1474,102 +2062,178 @@ class DmmGui:
             cur -= 1
         self.range_index_per_mode[idx_mode] = cur
         self._update_range_display()
+        self._schedule_range_commit()
 
     def _range_auto(self):
         idx_mode = self.current_mode_index
         self.range_index_per_mode[idx_mode] = 0
         self._update_range_display()
+        self._schedule_range_commit()
+
+    # Quiet time after the last range press before the range is sent (ms)
+    _RANGE_DEBOUNCE_MS = 150
+
+    def _schedule_range_commit(self) -> None:
+        """(Re)start the debounce timer so rapid presses send one RANG command."""
+        if self._range_commit_id is not None:
+            self.root.after_cancel(self._range_commit_id)
+        self._range_commit_id = self.root.after(self._RANGE_DEBOUNCE_MS, self._commit_range)
+
+    def _commit_range(self) -> None:
+        """Have the reader push the range the user settled on to the meter."""
+        self._range_commit_id = None
+        if not getattr(self, "connected", False):
+            return
+        self._request_config()
+
+    def _request_config(self) -> None:
+        """
+        Ask the reader thread to bring the meter in line with the panel
+        (mode, range, NPLC) before its next read, and wake it. Tk never does
+        configuration I/O itself, so it can't stall behind a slow read.
+        """
+        self._cfg_pending = True
+        self._wake_evt.set()
 
     # ---------- DMM interaction ----------
+    _PORTS_TTL_S = 2.0
+
     def list_candidate_ports(self) -> list[str]:
         """
         Return a list of usable serial port names for the GUI.
 
-        Prefers CP210x devices; if none, returns all ports.
+        Prefers CP210x devices; if none, returns all ports. Results are reused
+        for _PORTS_TTL_S seconds, since enumerating ports is slow on some hosts.
         """
         if serial is None:
             return []
 
+        now = time.monotonic()
+        cached = self._ports_cache
+        if cached is not None and now - cached[0] < self._PORTS_TTL_S:
+            return list(cached[1])
+
         ports = list(serial.tools.list_ports.comports())
-        if not ports:
-            return []
 
-        # It seems BK Precision 2831Es are programmed (or not programmed at all) 
+        # It seems BK Precision 2831Es are programmed (or not programmed at all) 
         # and have a serial number of 0001
-        cp210x = [p.device for p in ports if _is_cp210x_port(p) and p.serial_number == "0001"]
-        if cp210x:
-            return cp210x
+        names = [p.device for p in ports if _is_cp210x_port(p) and p.serial_number == "0001"]
+        if not names:
+            names = [p.device for p in ports]
+
+        self._ports_cache = (now, names)
+        return list(names)
+
+    def _refresh_ports_menu(self, event=None) -> None:
+        """Fill the Port menu with the current candidate ports (on open)."""
+        try:
+            ports = self.list_candidate_ports()
+        except Exception:
+            ports = []
+        if ports == self._port_menu_ports:
+            return
+        self._port_menu_ports = ports
 
-        return [p.device for p in ports]
+        menu = self.port_menu["menu"]
+        menu.delete(0, "end")
+        for name in ["Auto"] + ports:
+            menu.add_command(label=name, command=lambda v=name: self.port_var.set(v))
 
     def _connect_to_dmm(self) -> None:
-        # Apply GUI-selected baud to the driver before attempting connection
+        gui_baud = None
         if hasattr(self, "baud_var"):
             try:
                 gui_baud = int(self.baud_var.get())
-                if hasattr(self.dmm, "set_baudrate"):
-                    self.dmm.set_baudrate(gui_baud)
-                else:
-                    self.dmm.baud = gui_baud
             except Exception as e:
-                self.status_var.set(f"Invalid baud rate selection: {e}")
+                self._set_var(self.status_var, f"Invalid baud rate selection: {e}")
                 return
 
-        # Apply GUI-selected port (or Auto)
+        # GUI-selected port, or None for Auto (let the driver pick one)
+        port = None
         if hasattr(self, "port_var"):
             selection = self.port_var.get()
             if selection and selection != "Auto":
-                # User forced a specific port
-                self.dmm.com_port = selection
-            else:
-                # Let the driver pick a port on its own
-                self.dmm.com_port = None
+                port = selection
 
-        self.status_var.set(
-            f"Connecting to DMM @ {getattr(self.dmm, 'baud', '???')} baud..."
+        self._set_var(
+            self.status_var,
+            f"Connecting to DMM @ {gui_baud or getattr(self.dmm, 'baud', '???')} baud..."
         )
-        ok = self.dmm.connect()
+
+        def job():
+            # Reader thread, between reads: retuning the port can't land
+            # in the middle of one
+            if gui_baud is not None:
+                if hasattr(self.dmm, "set_baudrate"):
+                    self.dmm.set_baudrate(gui_baud)
+                else:
+                    self.dmm.baud = gui_baud
+            self.dmm.com_port = port
+            ok = self.dmm.connect()
+            self._reset_instr_state()
+            return ok
+
+        self._submit(job, self._on_connect_done)
+
+    def _on_connect_done(self, ok, error: Optional[str]) -> None:
+        """Tk side of _connect_to_dmm, once the reader has tried to connect."""
+        if error:
+            self._set_var(self.status_var, f"Connect failed: {error}")
+            self.connected = False
+            return
         if not ok:
-            self.status_var.set("DMM not found (check USB/COM port / baud).")
+            self._set_var(self.status_var, "DMM not found (check USB/COM port / baud).")
             self.connected = False
             return
 
         self.connected = True
-        self.status_var.set(
+        self._set_var(
+            self.status_var,
             f"Connected on {self.dmm.com_port} @ {getattr(self.dmm, 'baud', '???')} baud"
         )
+        self._saved_port = self.dmm.com_port
+        # Put the meter in the mode the panel shows (also wakes the reader)
+        self._apply_mode(self.current_mode_index)
 
     def _on_mode_button(self, idx: int) -> None:
         self.current_mode_index = idx
         self._apply_mode(idx)
 
     def _apply_mode(self, index: int) -> None:
-        mode = self.modes[index]
-        self.function_var.set(mode["func"])
-        self.unit_var.set(mode["units"])
+        # Anything the reader has in flight was taken for the old setup
+        self._req_seq += 1
+        func = self._mode_funcs[index]
+        self._set_var(self.function_var, func)
+        self._set_var(self.unit_var, self._mode_units[index])
+        # Don't leave the old mode's reading up under the new units
+        self._request_render(None)
 
         # New mode always starts in AUTO range
         self.range_index_per_mode[index] = 0
         self._update_range_display()
 
-        # Button highlight
-        for i, b in self.mode_buttons.items():
-            if i == index:
-                b.configure(relief="sunken", state="disabled")
-            else:
-                b.configure(relief="raised", state="normal")
+        # Button highlight: only the previous and new buttons change
+        prev = self._shown_mode_index
+        if prev != index:
+            changed = range(len(self.mode_buttons)) if prev is None else (prev, index)
+            for i in changed:
+                b = self.mode_buttons[i]
+                if b is None:
+                    continue
+                if i == index:
+                    b.configure(relief="sunken", state="disabled")
+                else:
+                    b.configure(relief="raised", state="normal")
+            self._shown_mode_index = index
 
         if not getattr(self, "connected", False):
             # still update NPLC button visuals even if not connected
             self._update_nplc_buttons()
             return
 
-        try:
-            if hasattr(self.dmm, "_set_function"):
-                self.dmm._set_function(mode["func"])
-        except Exception as e:
-            self.status_var.set(f"Failed to set mode: {e}")
-            self.connected = False
+        # Configure and read the new mode right away rather than after the
+        # old mode's delay
+        self._request_config()
 
         # NEW: update NPLC buttons on mode change
         self._update_nplc_buttons()
@@ -1584,52 +2248,48 @@ class DmmGui:
           and make the button look normal.
         """
         if not self.connected:
-            self.status_var.set("Not connected")
+            self._set_var(self.status_var, "Not connected")
             return
 
         # Currently disabled -> enable
         if not self.ref_enabled:
-            ok = False
-            try:
-                if hasattr(self.dmm, "enable_reference"):
-                    ok = self.dmm.enable_reference()
-            except Exception as e:
-                self.status_var.set(f"REF enable error: {e}")
-                ok = False
+            def enabled(ok, error):
+                if error:
+                    self._set_var(self.status_var, f"REF enable error: {error}")
+                elif ok:
+                    self.ref_enabled = True
+                    self.ref_frame.grid()              # show the text box + Apply
+                    self.ref_button.config(relief="sunken")
+                    self._set_var(self.status_var, "Reference enabled")
+                else:
+                    self._set_var(self.status_var, "Failed to enable reference")
 
-            if ok:
-                self.ref_enabled = True
-                self.ref_frame.grid()              # show the text box + Apply
-                self.ref_button.config(relief="sunken")
-                self.status_var.set("Reference enabled")
-            else:
-                self.status_var.set("Failed to enable reference")
+            fn = getattr(self.dmm, "enable_reference", None)
+            self._submit(fn or (lambda: False), enabled)
             return
 
         # Currently enabled -> disable
-        ok = False
-        try:
-            if hasattr(self.dmm, "disable_reference"):
-                ok = self.dmm.disable_reference()
-        except Exception as e:
-            self.status_var.set(f"REF disable error: {e}")
-            ok = False
-
-        if ok:
-            self.ref_enabled = False
-            self.ref_frame.grid_remove()          # hide the text box + Apply
-            self.ref_button.config(relief="raised")
-            self.status_var.set("Reference disabled")
-        else:
-            self.status_var.set("Failed to disable reference")
+        def disabled(ok, error):
+            if error:
+                self._set_var(self.status_var, f"REF disable error: {error}")
+            elif ok:
+                self.ref_enabled = False
+                self.ref_frame.grid_remove()          # hide the text box + Apply
+                self.ref_button.config(relief="raised")
+                self._set_var(self.status_var, "Reference disabled")
+            else:
+                self._set_var(self.status_var, "Failed to disable reference")
+
+        fn = getattr(self.dmm, "disable_reference", None)
+        self._submit(fn or (lambda: False), disabled)
 
     def _apply_reference_from_gui(self):
         if not self.connected:
-            self.status_var.set("Not connected")
+            self._set_var(self.status_var, "Not connected")
             return
 
         if not self.ref_enabled:
-            self.status_var.set("REF disabled")
+            self._set_var(self.status_var, "REF disabled")
             return
 
         # validate input
@@ -1637,7 +2297,7 @@ class DmmGui:
         try:
             val = float(raw)
         except ValueError:
-            self.status_var.set("Invalid REF")
+            self._set_var(self.status_var, "Invalid REF")
             return
 
         func = (self.dmm.active_function or "").lower()
@@ -1646,81 +2306,255 @@ class DmmGui:
             lo, hi = self.dmm._ref_valid_range(func)
         except ValueError as e:
             # REF is not supported in this mode; tell the user and bail
-            self.status_var.set(str(e))
+            self._set_var(self.status_var, str(e))
             return
 
         if val < lo or (hi != float("inf") and val > hi):
-            self.status_var.set(f"REF out of range ({lo} to {hi})")
+            self._set_var(self.status_var, f"REF out of range ({lo} to {hi})")
             return
 
-        if self.dmm.set_reference(val):
-            self.status_var.set(f"REF set to {val}")
-        else:
-            self.status_var.set("REF set failed")
+        def done(ok, error):
+            if ok:
+                self._set_var(self.status_var, f"REF set to {val}")
+            else:
+                self._set_var(self.status_var, "REF set failed")
+
+        self._submit(lambda: self.dmm.set_reference(val), done)
 
     def _acquire_reference_from_gui(self):
         if not self.connected:
-            self.status_var.set("Not connected")
+            self._set_var(self.status_var, "Not connected")
             return
 
         if not self.ref_enabled:
-            self.status_var.set("Reference disabled")
+            self._set_var(self.status_var, "Reference disabled")
             return
 
-        try:
-            value = self.dmm.acquire_reference_from_input()
-        except Exception as e:
-            self.status_var.set(f"REF acquire failed: {e}")
-            return
-
-        if value is None:
-            self.status_var.set("REF acquire failed")
-            return
+        def done(value, error):
+            if error:
+                self._set_var(self.status_var, f"REF acquire failed: {error}")
+                return
+            if value is None:
+                self._set_var(self.status_var, "REF acquire failed")
+                return
+            # Update the reference entry box
+            self.ref_entry_var.set(f"{value:g}")
+            self._set_var(self.status_var, f"Reference acquired: {value:g}")
 
-        # Update the reference entry box
-        self.ref_entry_var.set(f"{value:g}")
-        self.status_var.set(f"Reference acquired: {value:g}")
+        self._submit(self.dmm.acquire_reference_from_input, done)
 
     def _disable_ref_from_gui(self):
         if not self.connected:
-            self.status_var.set("Not connected")
+            self._set_var(self.status_var, "Not connected")
             return
 
-        if self.dmm.disable_reference():
-            self.ref_enabled = False
-            self.ref_frame.grid_remove()
-            self.status_var.set("Reference disabled")
-        else:
-            self.status_var.set("REF disable failed")
+        def done(ok, error):
+            if ok:
+                self.ref_enabled = False
+                self.ref_frame.grid_remove()
+                self._set_var(self.status_var, "Reference disabled")
+            else:
+                self._set_var(self.status_var, "REF disable failed")
+
+        self._submit(self.dmm.disable_reference, done)
 
-    def _read_once(self):
+    def _read_once(self, index: Optional[int] = None):
+        """
+        Take one reading for mode `index` (default: current mode).
+
+        Runs on the reader thread: it must not touch Tk, and comm errors are
+        raised to the caller rather than shown here.
+        """
         if not getattr(self, "connected", False):
             return None
 
-        mode = self.modes[self.current_mode_index]
-        func = mode["func"]
-        rng_code = self._get_current_range_code()
+        if index is None:
+            index = self.current_mode_index
+        reader = self._mode_readers[index]
+        if reader is None:
+            return None
+        fn, kwargs = reader
+        # Function/range/NPLC are pushed by _sync_config when the panel
+        # changes; the reader itself just fetches.
+        return fn(**kwargs)
 
-        try:
-            if func == "volt:dc" and hasattr(self.dmm, "read_dc_voltage"):
-                return self.dmm.read_dc_voltage(units=mode["units"], rng=rng_code)
-            elif func == "curr:dc" and hasattr(self.dmm, "read_dc_current"):
-                return self.dmm.read_dc_current(units=mode["units"], rng=rng_code)
-            elif func == "volt:ac" and hasattr(self.dmm, "read_ac_voltage"):
-                return self.dmm.read_ac_voltage(units=mode["units"], rng=rng_code)
-            elif func == "curr:ac" and hasattr(self.dmm, "read_ac_current"):
-                return self.dmm.read_ac_current(units=mode["units"], rng=rng_code)
-            elif func == "res" and hasattr(self.dmm, "read_resistance"):
-                return self.dmm.read_resistance(units="ohm", rng=rng_code)
-            elif func == "freq" and hasattr(self.dmm, "read_frequency"):
-                return self.dmm.read_frequency(units="Hz", rng=rng_code)
-            elif func == "per" and hasattr(self.dmm, "read_period"):
-                return self.dmm.read_period(units="s")
-            else:
-                return None
-        except Exception as e:
-            self.status_var.set(f"Read error: {e}")
+    def _read_triggered(self, index: int):
+        """Reader-thread half of the Trigger button: BUS trigger + fetch."""
+        if not getattr(self, "connected", False):
             return None
+        return self.dmm.trigger_read()
+
+    # ---------- instrument state cache ----------
+
+    def _reset_instr_state(self) -> None:
+        """
+        Forget what we believe the meter is set to: after connect, and after
+        a failed read (the driver then drops its own config cache too).
+        Call with _dmm_lock held once the reader thread is running.
+        """
+        self._instr_state = {"func": None, "rng": None, "nplc": None}
+
+    def _sync_config(self, index: int) -> None:
+        """
+        Reader thread, under _dmm_lock: push the panel's function, range and
+        NPLC for mode `index`, sending only what differs from _instr_state.
+        """
+        func = self._mode_funcs[index]
+        ranges = self._mode_ranges[index]
+        r = self.range_index_per_mode[index]
+        rng = ranges[r][1] if 0 <= r < len(ranges) else ranges[0][1]
+        nplc = None
+        if (self._nplc_mask >> index) & 1:
+            nplc = self._nplc_options[self._nplc_index_per_mode[index]]
+            if nplc == 1 and self._instr_state["func"] != func:
+                # The meter comes up at 1 PLC; only other choices (e.g. one
+                # restored from the last session) need sending
+                nplc = None
+        self._ensure_mode(func, rng, nplc)
+
+    def _ensure_mode(self, func: str, rng, nplc=None) -> None:
+        """
+        Bring the meter to `func` / range `rng` (and NPLC `nplc`, if given)
+        with one compound write covering only what differs from _instr_state.
+        The check, the write and the cache update all happen under _dmm_lock.
+        """
+        with self._dmm_lock:
+            st = self._instr_state
+            new_func = st["func"] != func
+            push_rng = new_func or st["rng"] != rng
+            push_nplc = nplc is not None and (new_func or st["nplc"] != nplc)
+            if not (new_func or push_rng or push_nplc):
+                return
+            self.dmm.configure(
+                func, rng if push_rng else None, nplc if push_nplc else None
+            )
+            if new_func:
+                # NPLC we knew about belonged to the previous function
+                st["nplc"] = None
+            st.update(func=func, rng=rng)
+            if push_nplc:
+                st["nplc"] = nplc
+
+    def _submit(self, fn, done=None) -> None:
+        """
+        Tk: have the reader thread run `fn()` under _dmm_lock before its next
+        read. `done(result, error)` is then called back on the Tk thread
+        (from _drain_and_render), with `error` the exception text or None.
+        """
+        self._jobs.put((fn, done))
+        self._wake_evt.set()
+
+    def _run_jobs(self) -> None:
+        """Reader thread: run the driver calls queued by _submit, in order."""
+        while True:
+            try:
+                fn, done = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                with self._dmm_lock:
+                    result, error = fn(), None
+            except Exception as e:
+                result, error = None, str(e)
+            if done is not None:
+                self._job_results.put((done, result, error))
+
+    def _reader_loop(self) -> None:
+        """
+        Reader thread: take a reading, hand it to Tk through `_read_q`, then
+        wait out the rest of the read period (or until `_wake_evt` is set by
+        a mode change / trigger / connect). Exits once `_stop_evt` is set.
+
+        The period is the slower of `target_fps` and the function/NPLC-based
+        meter rate. Reads are scheduled against a monotonic deadline that
+        advances by one period per read, so I/O time doesn't add drift; if
+        the loop falls more than two periods behind (or is woken early) the
+        deadline restarts from now. While the reading holds steady the period
+        is stretched (see _note_steady), up to 8x but not past 1200 ms. While
+        the driver is cooling down the loop just sleeps _COOLING_POLL_MS.
+        """
+        deadline = time.monotonic()  # when the next read should start
+        while not self._stop_evt.is_set():
+            self._run_jobs()
+            connected = getattr(self, "connected", False)
+            if connected and self._is_cooling():
+                # Driver is cooling down after comm errors; don't hammer the
+                # meter, and don't bother working out the read period
+                self._wake_evt.wait(self._COOLING_POLL_MS / 1000.0)
+                self._wake_evt.clear()
+                deadline = time.monotonic()
+                continue
+
+            period_ms = max(1000.0 / max(self.target_fps, 0.1), self._compute_update_delay_ms())
+            mult = 1 << min(3, self._steady_count // self._STEADY_READS)
+            if mult > 1:
+                period_ms = max(period_ms, min(1200.0, period_ms * mult))
+
+            if connected:
+                # Take the config request, then seq, then the mode: Tk sets
+                # the mode, bumps seq and only then raises _cfg_pending
+                sync = self._cfg_pending
+                self._cfg_pending = False
+                seq = self._req_seq
+                index = self.current_mode_index
+                error = None
+                try:
+                    with self._dmm_lock:
+                        if sync:
+                            self._sync_config(index)
+                        if self._trigger_pending:
+                            self._trigger_pending = False
+                            value = self._read_triggered(index)
+                        else:
+                            value = self._read_once(index)
+                except Exception as e:
+                    value, error = None, str(e)
+                    # The driver invalidates its config cache when a fetch or
+                    # configure fails; resend everything before the next read
+                    with self._dmm_lock:
+                        self._reset_instr_state()
+                    self._cfg_pending = True
+                self._note_steady(index, value)
+                item = (seq, index, value, time.monotonic(), error)
+                try:
+                    self._read_q.put_nowait(item)
+                except queue.Full:
+                    # Tk is behind: drop the oldest reading, keep the newest
+                    try:
+                        self._read_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._read_q.put_nowait(item)
+
+            period = period_ms / 1000.0
+            deadline += period
+            now = time.monotonic()
+            if now - deadline > 2.0 * period:
+                deadline = now  # fell well behind; don't burst to catch up
+            if self._wake_evt.wait(max(0.001, deadline - now)):
+                deadline = time.monotonic()
+            self._wake_evt.clear()
+
+    # Readings that must agree (to 1 ppm) before each doubling of the period
+    _STEADY_READS = 8
+
+    def _note_steady(self, index: int, value) -> None:
+        """
+        Reader thread: count consecutive readings of mode `index` equal to
+        the previous one within 1 ppm; anything else resets the count.
+        """
+        last = self._last_reading
+        if (
+            value is not None
+            and last is not None
+            and last[0] == index
+            and abs(value - last[1]) <= 1e-6 * max(abs(value), 1e-12)
+        ):
+            self._steady_count += 1
+        else:
+            self._steady_count = 0
+        self._last_reading = None if value is None else (index, value)
+
     # ---------- update timing based on NPLC + function ----------
 
     def _compute_update_delay_ms(self) -> int:
@@ -1738,100 +2572,195 @@ class DmmGui:
           NPLC 0.1  -> Fast
           NPLC 1    -> Med
           NPLC 10   -> Slow
-        """
-
-        # Default fallback (original behavior ~200ms)
-        default_delay = 200
 
-        try:
-            mode = self.modes[self.current_mode_index]
-        except Exception:
-            return default_delay
-
-        func = mode.get("func", "")
-
-        # Map function -> (slow, med, fast) readings/sec
-        # From the datasheet table; approximated for GUI pacing only.
-        rates_slow_med_fast = None
-
-        if func in ("volt:dc", "curr:dc", "volt:ac", "curr:ac", "temp"):
-            # Treat temperature similar to DC in terms of update feel
-            rates_slow_med_fast = (5.0, 10.0, 25.0)
-        elif func == "res":
-            # Distinguish high-ohm range (20 MΩ and above)
-            label, code = self._get_current_range_tuple()
-            label = (label or "").lower()
-            code = (code or "").lower() if code is not None else ""
-
-            is_high_ohm = "20 m" in label or code in ("20e6",)
-            if is_high_ohm:
-                rates_slow_med_fast = (1.3, 2.6, 5.6)
-            else:
-                rates_slow_med_fast = (5.0, 10.0, 25.0)
-        elif func in ("freq", "per"):
-            rates_slow_med_fast = (1.0, 2.0, 3.9)
-
-        if rates_slow_med_fast is None:
-            # Unknown function type -> keep original behavior
-            return default_delay
-
-        # Pick which speed (slow/med/fast) based on NPLC index
-        # self._nplc_index_per_mode is aligned with self.modes:
-        #   index 0 -> NPLC 0.1  -> Fast
-        #   index 1 -> NPLC 1    -> Med
-        #   index 2 -> NPLC 10   -> Slow
-        try:
-            nplc_idx = self._nplc_index_per_mode[self.current_mode_index]
-        except Exception:
-            nplc_idx = 1  # assume medium
+        The result depends only on (mode, NPLC choice, range), so it is
+        memoised in `_delay_cache` under that key.
+        """
+        index = self.current_mode_index
+        if not 0 <= index < len(self.modes):
+            return _DEFAULT_DELAY_MS
+        key = (index, self._nplc_index_per_mode[index], self.range_index_per_mode[index])
+        delay_ms = self._delay_cache.get(key)
+        if delay_ms is None:
+            delay_ms = self._delay_cache[key] = self._delay_ms_for(index)
+        return delay_ms
 
-        slow, med, fast = rates_slow_med_fast
+    def _delay_ms_for(self, index: int) -> int:
+        """
+        Uncached body of _compute_update_delay_ms for a valid mode `index`
+        (the per-mode lists all have one entry per mode).
+        """
+        keys = self._mode_rate_keys[index]
+        rng_idx = self.range_index_per_mode[index]
+        key = keys[rng_idx] if 0 <= rng_idx < len(keys) else keys[0]
+        nplc_idx = min(max(self._nplc_index_per_mode[index], 0), 2)
 
-        if nplc_idx <= 0:       # 0.1 NPLC -> fast
-            rate_hz = fast
-        elif nplc_idx == 1:     # 1 NPLC   -> medium
-            rate_hz = med
-        else:                   # 10 NPLC  -> slow
-            rate_hz = slow
+        return _DELAY_MS_TABLE.get((key, nplc_idx), _DEFAULT_DELAY_MS)
 
-        if rate_hz <= 0:
-            return default_delay
+    # How often Tk checks for finished readings (ms); the reader itself idles
+    # 1500 ms while the driver cools off, so Tk polls at that pace then too
+    _POLL_MS = 50
+    _COOLING_POLL_MS = 1500
+    _COOLING_MSG = "Cooling off after comm error..."
 
-        # Convert readings/sec to ms, with a small guard so we never hammer too fast.
-        delay_ms = int(1000.0 / rate_hz)
+    def _drain_and_render(self) -> None:
+        """
+        Tk side of the reader thread: show the newest finished reading for the
+        current mode and re-arm. Never blocks on serial I/O. The re-arm is in
+        a `finally`, so an unexpected error is reported by Tk but never stops
+        the display from updating.
+        """
+        self._after_id = None
+        if self._shutting_down:
+            return
+        poll_ms = self._POLL_MS
+        try:
+            changed = False
+            cooling = self._is_cooling()
+            if cooling != self._cooling_shown:
+                # Only touch the status bar when cooling starts or ends
+                self._cooling_shown = cooling
+                if cooling:
+                    changed |= self._set_var(self.status_var, self._COOLING_MSG)
+                elif self._var_cache.get(str(self.status_var)) == self._COOLING_MSG:
+                    changed |= self._set_var(self.status_var, "")
+            if cooling:
+                poll_ms = self._COOLING_POLL_MS
+
+            # Finish Tk-side handling of driver calls the reader has run
+            while True:
+                try:
+                    done, result, error = self._job_results.get_nowait()
+                except queue.Empty:
+                    break
+                done(result, error)
+
+            latest = None
+            get_nowait = self._read_q.get_nowait
+            seq = self._req_seq
+            while True:
+                try:
+                    item = get_nowait()
+                except queue.Empty:
+                    break
+                # Readings started before the last mode change are stale
+                if item[0] == seq:
+                    latest = item
+
+            if not getattr(self, "connected", False):
+                self._request_render(None)
+            elif latest is not None:
+                _, _, value, _, error = latest
+                self._request_render(value, error)
+
+            if changed:
+                # Redraw now; no need to wait for (or process) other pending events
+                self._update_idletasks()
+        finally:
+            self._after_id = self._after(poll_ms, self._drain_cb)
 
-        # Clamp to a reasonable GUI range (50ms–1200ms)
-        if delay_ms < 50:
-            delay_ms = 50
-        elif delay_ms > 1200:
-            delay_ms = 1200
+    def _request_render(self, value, error: Optional[str] = None) -> None:
+        """
+        Queue `value` (None shows "------") for display. Requests made before
+        Tk goes idle collapse into a single _do_render of the newest one.
+        """
+        self._pending_render = (value, error)
+        if not self._render_pending:
+            self._render_pending = True
+            self._after_idle(self._do_render_cb)
+
+    def _do_render(self) -> None:
+        """Idle callback: write the newest requested reading to the display."""
+        self._render_pending = False
+        value, error = self._pending_render
+        changed = False
+        if error:
+            changed |= self._set_var(self.status_var, f"Read error: {error}")
+        if value is None:
+            changed |= self._set_var(self.value_var, "------")
+        else:
+            text, units = self._mode_fmts[self.current_mode_index](value)
+            changed |= self._set_var(self.value_var, text)
+            changed |= self._set_var(self.unit_var, units)
+        if changed:
+            self._update_idletasks()
 
-        return delay_ms
-    
-    def _schedule_update(self) -> None:
-        # Base delay driven by NPLC + function, using datasheet reading rates
-        delay = self._compute_update_delay_ms()
+    # ---------- session settings ----------
 
-        # If the driver is cooling down after comm errors, don't hammer the meter
-        if hasattr(self.dmm, "is_cooling") and self.dmm.is_cooling():
-            # Make sure we back off a bit more than normal
-            delay = max(delay, 1500)
-            self.status_var.set("Cooling off after comm error...")
+    _SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".bkp2831e.json")
 
-        value = self._read_once()
-        if value is None:
-            self.value_var.set("------")
-        else:
-            self.value_var.set(f"{value:>12.6g}")
+    def _restore_settings(self) -> None:
+        """
+        Load last session's choices from _SETTINGS_PATH. A missing or
+        malformed file (or entry) just leaves the defaults in place.
+        """
+        try:
+            with open(self._SETTINGS_PATH, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
 
-        self.root.after(delay, self._schedule_update)
+        baud = data.get("baud")
+        if isinstance(baud, int) and hasattr(self.dmm, "set_baudrate"):
+            self.dmm.set_baudrate(baud)
+
+        mode = data.get("mode")
+        if isinstance(mode, int) and 0 <= mode < len(self.modes):
+            self.current_mode_index = mode
+
+        nplc = data.get("nplc")
+        if isinstance(nplc, list) and len(nplc) == len(self.modes):
+            n_opts = len(self._nplc_options)
+            self._nplc_index_per_mode = [
+                i if isinstance(i, int) and 0 <= i < n_opts else 1 for i in nplc
+            ]
+
+        port = data.get("port")
+        if isinstance(port, str) and port:
+            self._saved_port = port
+
+    def _save_settings(self) -> None:
+        """Write this session's choices to _SETTINGS_PATH (best effort)."""
+        data = {
+            "port": self._saved_port,
+            "baud": getattr(self.dmm, "baud", None),
+            "mode": self.current_mode_index,
+            "nplc": list(self._nplc_index_per_mode),
+        }
+        try:
+            with open(self._SETTINGS_PATH, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=2)
+        except OSError:
+            pass
 
     def on_closing(self):
-        if messagebox.askokcancel("Quit", "Do you want to quit?"):
-            try:
+        if self._shutting_down:
+            return  # quit dialog already up
+        # Stop the poll loop before the modal dialog so no after() callbacks
+        # are left to fire while the window is torn down
+        self._shutting_down = True
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if not messagebox.askokcancel("Quit", "Do you want to quit?"):
+            self._shutting_down = False
+            self._drain_and_render()
+            return
+        self._save_settings()
+        if self._range_commit_id is not None:
+            self.root.after_cancel(self._range_commit_id)
+            self._range_commit_id = None
+        # Let the reader finish its current read and exit before closing
+        self._stop_evt.set()
+        self._wake_evt.set()
+        self._reader_thread.join(timeout=2.0)
+        try:
+            with self._dmm_lock:
                 self.dmm.close()
-            finally:
-                self.root.destroy()
+        finally:
+            self.root.destroy()
         
     def run(self) -> None:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -1840,6 +2769,11 @@ class DmmGui:
 # ---- optional CLI entrypoint -------------------------------------------------
 
 def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s][%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
     root = tk.Tk()
     gui = DmmGui(root)
     gui.run()